@@ -13,22 +13,12 @@ import os
 # Add the project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.config import GameConfig
-from src.game import Game
 
-
-def parse_args():
-    """Parse command line arguments for the Gravity Flip Runner game.
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the Gravity Flip Runner game.
 
     Returns:
-        argparse.Namespace: Parsed command line arguments containing:
-            - width (int): Window width in pixels.
-            - height (int): Window height in pixels.
-            - fps (int): Target frames per second.
-            - speed (float): Player movement speed.
-            - gravity (float): Gravity strength.
-            - jump (float): Jump force.
-            - debug (bool): Whether debug mode is enabled.
+        argparse.ArgumentParser: Parser for the game's command line options.
     """
     parser = argparse.ArgumentParser(
         description="Gravity Flip Runner - A 2D side-scrolling platformer with gravity mechanics"
@@ -82,17 +72,57 @@ def parse_args():
         help="Enable debug mode (shows hitboxes and debug info)"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the game loop with cProfile and write game.prof"
+    )
+    
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=None,
+        help="Quit after this many frames (default: run until closed)"
+    )
+    
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse command line arguments for the Gravity Flip Runner game.
+
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:]).
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments containing:
+            - width (int): Window width in pixels.
+            - height (int): Window height in pixels.
+            - fps (int): Target frames per second.
+            - speed (float): Player movement speed.
+            - gravity (float): Gravity strength.
+            - jump (float): Jump force.
+            - debug (bool): Whether debug mode is enabled.
+            - profile (bool): Whether to profile the game loop.
+            - frames (int or None): Number of frames to run before quitting.
+    """
+    return build_parser().parse_args(argv)
 
 
 def main():
     """Main entry point for the Gravity Flip Runner game.
 
     Parses command line arguments, creates a game configuration,
-    initializes the game instance, and starts the game loop.
+    initializes the game instance, and starts the game loop. With
+    --profile the loop runs under cProfile and the stats are written to
+    game.prof.
     """
     args = parse_args()
     
+    # Imported here so --help does not pay for loading pygame
+    from src.config import GameConfig
+    from src.game import Game
+    
     # Create configuration from command line args
     config = GameConfig(
         window_width=args.width,
@@ -107,7 +137,17 @@ def main():
     
     # Create and run game
     game = Game(config)
-    game.run()
+    
+    if args.profile:
+        import cProfile
+        import pstats
+        
+        profiler = cProfile.Profile()
+        profiler.runcall(game.run, args.frames)
+        profiler.dump_stats("game.prof")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    else:
+        game.run(args.frames)
 
 
 if __name__ == "__main__":
@@ -4,18 +4,30 @@ Contains all configurable game settings.
 """
 
 import os
+import sys
 from dataclasses import dataclass
 
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to
+# a regular instance __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class GameConfig:
-    """Configuration settings for the game."""
+    """Configuration settings for the game.
+
+    Instances are read from the per-frame physics code, so on Python 3.10+
+    the class is slotted for faster attribute access. It stays mutable
+    because debug flags are toggled at runtime.
+    """
     
     # Window settings
     window_width: int = 800
     window_height: int = 600
     fps: int = 60
     title: str = "Gravity Flip Runner"
+    hardware_display: bool = False  # Present frames through SDL's GPU renderer
+    dirty_rect_updates: bool = False  # Only send changed screen regions to the display
     
     # Player settings
     player_speed: float = 5.0
@@ -49,6 +61,8 @@ class GameConfig:
             WINDOW_WIDTH: Window width in pixels (default: 800)
             WINDOW_HEIGHT: Window height in pixels (default: 600)
             FPS: Target frames per second (default: 60)
+            HARDWARE_DISPLAY: Present through the GPU with vsync (default: false)
+            DIRTY_RECT_UPDATES: Only send changed regions to the display (default: false)
             PLAYER_SPEED: Player movement speed (default: 5.0)
             PLAYER_JUMP_FORCE: Player jump force (default: 15.0)
             GRAVITY_STRENGTH: Gravity strength (default: 0.8)
@@ -58,15 +72,18 @@ class GameConfig:
         Returns:
             GameConfig: A new GameConfig instance with values from environment.
         """
+        env = os.environ
         return cls(
-            window_width=int(os.getenv("WINDOW_WIDTH", 800)),
-            window_height=int(os.getenv("WINDOW_HEIGHT", 600)),
-            fps=int(os.getenv("FPS", 60)),
-            player_speed=float(os.getenv("PLAYER_SPEED", 5.0)),
-            player_jump_force=float(os.getenv("PLAYER_JUMP_FORCE", 15.0)),
-            gravity_strength=float(os.getenv("GRAVITY_STRENGTH", 0.8)),
-            debug_mode=os.getenv("DEBUG_MODE", "false").lower() == "true",
-            show_hitboxes=os.getenv("SHOW_HITBOXES", "false").lower() == "true",
+            window_width=int(env.get("WINDOW_WIDTH", 800)),
+            window_height=int(env.get("WINDOW_HEIGHT", 600)),
+            fps=int(env.get("FPS", 60)),
+            hardware_display=env.get("HARDWARE_DISPLAY", "false").lower() == "true",
+            dirty_rect_updates=env.get("DIRTY_RECT_UPDATES", "false").lower() == "true",
+            player_speed=float(env.get("PLAYER_SPEED", 5.0)),
+            player_jump_force=float(env.get("PLAYER_JUMP_FORCE", 15.0)),
+            gravity_strength=float(env.get("GRAVITY_STRENGTH", 0.8)),
+            debug_mode=env.get("DEBUG_MODE", "false").lower() == "true",
+            show_hitboxes=env.get("SHOW_HITBOXES", "false").lower() == "true",
         )
 
 
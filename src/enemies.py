@@ -19,6 +19,12 @@ class Enemy:
         gravity_direction: Current gravity state
     """
     
+    __slots__ = (
+        "config", "x", "y", "start_x", "width", "height", "patrol_distance",
+        "speed", "color", "dx", "dy", "direction", "on_ground", "_rect",
+        "_gravity_direction", "_signed_gravity", "_fall_clamp",
+    )
+    
     def __init__(
         self,
         x: float,
@@ -63,14 +69,46 @@ class Enemy:
         self.gravity_direction = 1
         self.on_ground = False
         
+        # Collision rectangle, reused and updated in place
+        self._rect = pygame.Rect(int(x), int(y), width, height)
+        
     @property
     def rect(self) -> pygame.Rect:
         """Get the enemy's collision rectangle.
         
+        The same Rect instance is returned on every access and refreshed
+        from the current position, so callers must not keep it across
+        frames or modify it.
+        
         Returns:
             pygame.Rect: Rectangle representing the enemy's hitbox.
         """
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        rect = self._rect
+        rect.update(int(self.x), int(self.y), self.width, self.height)
+        return rect
+    
+    @property
+    def gravity_direction(self) -> int:
+        """Get the gravity direction (1 for normal, -1 for inverted).
+        
+        Returns:
+            int: The current gravity direction.
+        """
+        return self._gravity_direction
+    
+    @gravity_direction.setter
+    def gravity_direction(self, direction: int) -> None:
+        """Set the gravity direction and cache the signed physics values.
+        
+        The signed gravity and fall speed limit only change when gravity
+        flips, so they are computed here instead of on every frame.
+        
+        Args:
+            direction: Gravity direction (1 for normal, -1 for inverted).
+        """
+        self._gravity_direction = direction
+        self._signed_gravity = self.config.gravity_strength * direction
+        self._fall_clamp = self.config.max_fall_speed * direction
     
     def set_gravity(self, direction: int) -> None:
         """Set the gravity direction for this enemy.
@@ -81,81 +119,46 @@ class Enemy:
         self.gravity_direction = direction
         self.on_ground = False
     
+    def get_x_extent(self) -> Tuple[float, float]:
+        """Get the horizontal span the enemy can reach while patrolling.
+        
+        The patrol turns around once the enemy is ``patrol_distance`` from
+        its start, so it overshoots by at most one step of ``speed``.
+        
+        Returns:
+            Tuple[float, float]: The (left, right) world x coordinates.
+        """
+        reach = self.patrol_distance + self.speed
+        return self.start_x - reach, self.start_x + reach + self.width
+    
     def apply_gravity(self) -> None:
         """Apply gravity to vertical velocity.
         
         Updates the enemy's vertical velocity based on gravity direction
         and clamps it to the maximum fall speed.
         """
-        gravity = self.config.gravity_strength * self.gravity_direction
-        self.dy += gravity
+        dy = self.dy + self._signed_gravity
         
         # Clamp fall speed
-        max_speed = self.config.max_fall_speed
-        if self.gravity_direction > 0:
-            self.dy = min(self.dy, max_speed)
-        else:
-            self.dy = max(self.dy, -max_speed)
+        fall_clamp = self._fall_clamp
+        if self._gravity_direction > 0:
+            if dy > fall_clamp:
+                dy = fall_clamp
+        elif dy < fall_clamp:
+            dy = fall_clamp
+        self.dy = dy
     
     def update(self, platforms: List["Platform"]) -> None:
         """
         Update enemy position and behavior.
         
-        Args:
-            platforms: List of platforms for collision detection
-        """
-        self.apply_gravity()
-        
-        # Patrol movement
-        self._patrol()
-        
-        # Update position
-        self.x += self.dx * self.direction
-        self.y += self.dy
-        
-        # Check collisions
-        self._check_collisions(platforms)
-    
-    def _patrol(self) -> None:
-        """Handle patrol behavior.
-        
-        Reverses the enemy's direction when it reaches the patrol
-        distance from its starting position.
-        """
-        distance_from_start = self.x - self.start_x
-        
-        if distance_from_start >= self.patrol_distance:
-            self.direction = -1
-        elif distance_from_start <= -self.patrol_distance:
-            self.direction = 1
-    
-    def _check_collisions(self, platforms: List["Platform"]) -> None:
-        """Check and resolve platform collisions.
+        Runs the same physics step as the batched ``update_enemies`` pass
+        used by the level, for this enemy alone.
         
         Args:
-            platforms: List of platforms to check for collisions.
+            platforms: List of platforms for collision detection
         """
-        enemy_rect = self.rect
-        self.on_ground = False
-        
-        for platform in platforms:
-            if enemy_rect.colliderect(platform.rect):
-                if self.gravity_direction > 0:  # Normal gravity
-                    if self.dy > 0:  # Falling down
-                        self.y = platform.rect.top - self.height
-                        self.dy = 0
-                        self.on_ground = True
-                    elif self.dy < 0:  # Moving up
-                        self.y = platform.rect.bottom
-                        self.dy = 0
-                else:  # Inverted gravity
-                    if self.dy < 0:  # Falling up
-                        self.y = platform.rect.bottom
-                        self.dy = 0
-                        self.on_ground = True
-                    elif self.dy > 0:  # Moving down
-                        self.y = platform.rect.top - self.height
-                        self.dy = 0
+        update_enemies([self], [platform.rect for platform in platforms])
     
     def get_render_rect(self, camera_x: float = 0) -> pygame.Rect:
         """Get rectangle adjusted for camera position.
@@ -172,12 +175,89 @@ class Enemy:
             self.width,
             self.height
         )
+    
+    def fill_render_rect(self, rect: pygame.Rect, camera_x: float = 0) -> pygame.Rect:
+        """Write the camera-adjusted rectangle into an existing Rect.
+        
+        Same result as ``get_render_rect`` without allocating a new Rect.
+        
+        Args:
+            rect: Rect to overwrite.
+            camera_x: The camera's X offset for scrolling.
+            
+        Returns:
+            pygame.Rect: The given rect, now in screen coordinates.
+        """
+        rect.update(int(self.x - camera_x), int(self.y), self.width, self.height)
+        return rect
+
+
+def update_enemies(enemies: List[Enemy], platform_rects: List[pygame.Rect]) -> None:
+    """
+    Update every enemy in a single batched pass.
+    
+    Gravity comes from ``Enemy.apply_gravity``; patrol, movement and
+    collision resolution are fused into one loop that works on local
+    variables and writes each enemy's state back once. The platform
+    rectangles are taken as given and shared by every enemy, so callers
+    holding cached rects, like the level, build nothing per frame.
+    
+    Args:
+        enemies: Enemies to update
+        platform_rects: Collision rectangles of the platforms to test
+    """
+    for enemy in enemies:
+        # Gravity with clamped fall speed
+        enemy.apply_gravity()
+        dy = enemy.dy
+        gravity_direction = enemy._gravity_direction
+        
+        # Patrol
+        x = enemy.x
+        direction = enemy.direction
+        distance_from_start = x - enemy.start_x
+        if distance_from_start >= enemy.patrol_distance:
+            direction = -1
+        elif distance_from_start <= -enemy.patrol_distance:
+            direction = 1
+        
+        # Update position
+        x += enemy.dx * direction
+        y = enemy.y + dy
+        
+        # Resolve platform collisions against the first overlap
+        height = enemy.height
+        on_ground = False
+        enemy_rect = enemy._rect
+        enemy_rect.update(int(x), int(y), enemy.width, height)
+        index = enemy_rect.collidelist(platform_rects)
+        if index != -1 and dy:
+            platform_rect = platform_rects[index]
+            on_ground = dy * gravity_direction > 0
+            y = platform_rect.top - height if dy > 0 else platform_rect.bottom
+            dy = 0
+        
+        enemy.x = x
+        enemy.y = y
+        enemy.dy = dy
+        enemy.direction = direction
+        enemy.on_ground = on_ground
 
 
 class Hazard:
     """
     Static hazard that damages the player on contact.
     Examples: spikes, lava, electric barriers.
+    
+    Hazards never move: position and size are read-only, so the
+    collision rectangle built at construction, and the level's hit-test
+    index built from it, always match them. Replace the hazard in the
+    level to move it.
+    
+    Attributes:
+        x, y: Position (read-only)
+        width, height: Dimensions (read-only)
+        rect: Collision rectangle
     """
     
     def __init__(
@@ -201,20 +281,62 @@ class Hazard:
             config: Game configuration
         """
         self.config = config or default_config
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
         self.color = color or self.config.hazard_color
         
+        # Hazards never move, so the collision rectangle is built once
+        self._rect = pygame.Rect(int(x), int(y), width, height)
+    
+    @property
+    def x(self) -> float:
+        """Get the hazard's x position.
+        
+        Returns:
+            float: The x position in world coordinates.
+        """
+        return self._x
+    
+    @property
+    def y(self) -> float:
+        """Get the hazard's y position.
+        
+        Returns:
+            float: The y position in world coordinates.
+        """
+        return self._y
+    
+    @property
+    def width(self) -> int:
+        """Get the hazard's width.
+        
+        Returns:
+            int: The width in pixels.
+        """
+        return self._width
+    
+    @property
+    def height(self) -> int:
+        """Get the hazard's height.
+        
+        Returns:
+            int: The height in pixels.
+        """
+        return self._height
+    
     @property
     def rect(self) -> pygame.Rect:
         """Get the hazard's collision rectangle.
         
+        The same Rect instance is returned on every access; callers must
+        not modify it.
+        
         Returns:
             pygame.Rect: Rectangle representing the hazard's hitbox.
         """
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        return self._rect
     
     def get_render_rect(self, camera_x: float = 0) -> pygame.Rect:
         """Get rectangle adjusted for camera position.
@@ -231,3 +353,18 @@ class Hazard:
             self.width,
             self.height
         )
+    
+    def fill_render_rect(self, rect: pygame.Rect, camera_x: float = 0) -> pygame.Rect:
+        """Write the camera-adjusted rectangle into an existing Rect.
+        
+        Same result as ``get_render_rect`` without allocating a new Rect.
+        
+        Args:
+            rect: Rect to overwrite.
+            camera_x: The camera's X offset for scrolling.
+            
+        Returns:
+            pygame.Rect: The given rect, now in screen coordinates.
+        """
+        rect.update(int(self.x - camera_x), int(self.y), self.width, self.height)
+        return rect
@@ -49,11 +49,15 @@ class Game:
         pygame.init()
         pygame.font.init()
         
-        # Create display
-        self.screen = pygame.display.set_mode((
-            self.config.window_width,
-            self.config.window_height
-        ))
+        # Create display; the hardware display draws into the same
+        # software surface but uploads it to a GPU texture and presents
+        # it through SDL's renderer, synced to the monitor
+        hardware_display = self.config.hardware_display
+        self.screen = pygame.display.set_mode(
+            (self.config.window_width, self.config.window_height),
+            pygame.SCALED if hardware_display else 0,
+            vsync=int(hardware_display)
+        )
         pygame.display.set_caption(self.config.title)
         
         # Clock for frame rate
@@ -63,6 +67,7 @@ class Game:
         self.state = GameState.RUNNING
         self.lives = 3
         self.score = 0
+        self._max_x = 0.0
         self.running = True
         
         # Initialize game objects
@@ -93,15 +98,15 @@ class Game:
         Handles quit events, debug toggles, pause toggling, and restart requests.
         Updates the running and state attributes based on user input.
         """
-        events = pygame.event.get()
-        
-        for event in events:
+        # Process the event queue in a single pass
+        input_handler = self.input_handler
+        input_handler.begin_frame()
+        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
                 return
-        
-        # Process input
-        self.input_handler.process_events(events)
+            input_handler.handle_event(event)
+        input_handler.sync_held(pygame.key.get_pressed())
         
         # Handle global actions
         if self.input_handler.should_quit():
@@ -152,8 +157,13 @@ class Game:
         if self.state != GameState.RUNNING:
             return
         
-        # Update player
-        self.player.update(self.level.platforms)
+        # Update player against the platforms it can reach this frame
+        player = self.player
+        reach = abs(player.dx) + 1
+        player.update_with_rects(self.level.get_collision_rects(
+            player.x - reach,
+            player.x + player.width + reach
+        ))
         
         # Update level (camera, platforms, enemies)
         self.level.update(self.player.x)
@@ -161,8 +171,14 @@ class Game:
         # Check collisions
         self._check_collisions()
         
-        # Update score based on distance
-        self.score = max(self.score, int(self.player.x / 10))
+        # Update score based on distance, only when a new furthest point
+        # is reached
+        player_x = self.player.x
+        if player_x > self._max_x:
+            self._max_x = player_x
+            distance_score = int(player_x // 10)
+            if distance_score > self.score:
+                self.score = distance_score
     
     def _check_collisions(self) -> None:
         """Check for player collisions with hazards and enemies.
@@ -170,19 +186,16 @@ class Game:
         Checks collision with enemies, hazards, and level bounds.
         Calls _player_hit() if any collision is detected.
         """
-        # Check enemy collision
-        if self.player.check_enemy_collision(self.level.enemies):
-            self._player_hit()
-        
-        # Check hazard collision
-        if self.player.check_hazard_collision(self.level.hazards):
-            self._player_hit()
-        
-        # Check out of bounds
-        if self.level.is_player_out_of_bounds(
-            self.player.x,
-            self.player.y,
-            self.player.height
+        player = self.player
+        level = self.level
+        
+        # Enemies and hazards near the player in one pass, then the cheap
+        # bounds test
+        player_rect = player.rect
+        threat_rects = level.get_threat_rects(player_rect.left, player_rect.right)
+        if (
+            player_rect.collidelist(threat_rects) != -1 or
+            level.is_player_out_of_bounds(player.x, player.y, player.height)
         ):
             self._player_hit()
     
@@ -225,7 +238,7 @@ class Game:
             self.renderer.draw_game_over()
         
         # Update display
-        pygame.display.flip()
+        self.renderer.present()
     
     def restart(self) -> None:
         """Restart the game.
@@ -235,16 +248,25 @@ class Game:
         """
         self.lives = 3
         self.score = 0
+        self._max_x = 0.0
         self.state = GameState.RUNNING
         self._init_game_objects()
     
-    def run(self) -> None:
+    def run(self, max_frames: Optional[int] = None) -> None:
         """Run the main game loop.
         
         Continuously handles events, processes input, updates state, and renders
         until the running flag is set to False. Cleans up pygame on exit.
+        
+        Args:
+            max_frames: Stop after this many frames (runs until quit if None)
         """
+        frames = 0
         while self.running:
+            if max_frames is not None and frames >= max_frames:
+                break
+            frames += 1
+            
             # Handle events
             self.handle_events()
             
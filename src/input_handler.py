@@ -4,13 +4,22 @@ Maps keyboard input to player actions.
 """
 
 import pygame
-from typing import Dict, Set, Optional, Callable, Any
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Tuple
+)
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
+from types import MappingProxyType
 
+from .config import DATACLASS_SLOTS
 
-class Action(Enum):
-    """Enumeration of possible player actions."""
+
+class Action(IntEnum):
+    """Enumeration of possible player actions.
+    
+    Members are ints, so they hash as ints and double as bit positions
+    in the action bitmasks without going through ``.value``.
+    """
     MOVE_LEFT = auto()
     MOVE_RIGHT = auto()
     JUMP = auto()
@@ -21,23 +30,135 @@ class Action(Enum):
     DEBUG_TOGGLE = auto()
 
 
-@dataclass
+# Bit positions of the movement actions, resolved once at import
+_MOVE_LEFT_SHIFT = Action.MOVE_LEFT.value
+_MOVE_RIGHT_SHIFT = Action.MOVE_RIGHT.value
+
+# Bits of the actions polled by the should_* predicates every frame
+_JUMP_BIT = 1 << Action.JUMP.value
+_FLIP_GRAVITY_BIT = 1 << Action.FLIP_GRAVITY.value
+_PAUSE_BIT = 1 << Action.PAUSE.value
+_RESTART_BIT = 1 << Action.RESTART.value
+_QUIT_BIT = 1 << Action.QUIT.value
+_DEBUG_TOGGLE_BIT = 1 << Action.DEBUG_TOGGLE.value
+
+# Each action paired with its bit in the action bitmasks
+_ACTION_BITS = tuple((action, 1 << action.value) for action in Action)
+
+# Length of the per-handler callback table, indexed directly by Action
+_CALLBACK_SLOTS = max(Action) + 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class KeyBinding:
-    """Represents a key binding for an action."""
+    """Represents a key binding for an action.
+    
+    Bindings are immutable and can be shared between handlers; rebind an
+    action to change its keys.
+    """
     primary: int
     secondary: Optional[int] = None
 
 
+def _build_key_index(
+    bindings: Mapping[Action, KeyBinding]
+) -> Tuple[Dict[int, Action], List[Tuple[int, int, Optional[int]]]]:
+    """
+    Build the key lookup tables for a set of bindings.
+    
+    When a key is bound to several actions, the first binding wins.
+    
+    Args:
+        bindings: Mapping of actions to key bindings
+    
+    Returns:
+        The key code to action map, and an ``(action bit, primary,
+        secondary)`` entry per action for polling a keyboard snapshot.
+    """
+    key_to_action: Dict[int, Action] = {}
+    held_keys: List[Tuple[int, int, Optional[int]]] = []
+    for action, binding in bindings.items():
+        key_to_action.setdefault(binding.primary, action)
+        if binding.secondary is not None:
+            key_to_action.setdefault(binding.secondary, action)
+        held_keys.append((1 << action.value, binding.primary, binding.secondary))
+    return key_to_action, held_keys
+
+
+class _ActionMaskView:
+    """
+    Set-like view over one of an InputHandler's action bitmasks.
+    
+    Each action occupies bit ``action.value`` of an integer attribute on
+    the handler. The view lets callers keep using ``add``, ``discard``,
+    ``in`` and ``len`` while the handler itself works with plain integers.
+    """
+    
+    __slots__ = ("_handler", "_attr")
+    
+    def __init__(self, handler: "InputHandler", attr: str):
+        """
+        Initialize the view.
+        
+        Args:
+            handler: Input handler owning the bitmask
+            attr: Name of the integer bitmask attribute on the handler
+        """
+        self._handler = handler
+        self._attr = attr
+    
+    def __contains__(self, action: Action) -> bool:
+        return bool(getattr(self._handler, self._attr) >> action & 1)
+    
+    def __iter__(self) -> Iterator[Action]:
+        mask = getattr(self._handler, self._attr)
+        return iter([action for action, bit in _ACTION_BITS if mask & bit])
+    
+    def __len__(self) -> int:
+        return bin(getattr(self._handler, self._attr)).count("1")
+    
+    def add(self, action: Action) -> None:
+        """Mark an action as set.
+
+        Args:
+            action: The action to add.
+        """
+        mask = getattr(self._handler, self._attr)
+        setattr(self._handler, self._attr, mask | 1 << action)
+    
+    def discard(self, action: Action) -> None:
+        """Clear an action if it is set.
+
+        Args:
+            action: The action to remove.
+        """
+        mask = getattr(self._handler, self._attr)
+        setattr(self._handler, self._attr, mask & ~(1 << action))
+    
+    def clear(self) -> None:
+        """Clear all actions."""
+        setattr(self._handler, self._attr, 0)
+
+
 class InputHandler:
     """
     Handles keyboard input and maps to game actions.
     
     Attributes:
-        bindings: Dictionary mapping actions to key bindings
-        held_actions: Set of currently held actions
+        bindings: Read-only mapping of actions to key bindings; use
+            rebind to change it
+        supported_actions: Frozen set of the actions that have a binding
+        held_actions: Set-like view of currently held actions
     """
     
-    DEFAULT_BINDINGS: Dict[Action, KeyBinding] = {
+    __slots__ = (
+        "_bindings", "supported_actions", "held_actions", "_pressed_this_frame",
+        "_released_this_frame", "_key_to_action", "_held_keys",
+        "_held_mask", "_pressed_mask", "_released_mask", "_callbacks",
+    )
+    
+    # Read-only, so handlers using the defaults can share it
+    DEFAULT_BINDINGS: Mapping[Action, KeyBinding] = MappingProxyType({
         Action.MOVE_LEFT: KeyBinding(pygame.K_LEFT, pygame.K_a),
         Action.MOVE_RIGHT: KeyBinding(pygame.K_RIGHT, pygame.K_d),
         Action.JUMP: KeyBinding(pygame.K_SPACE, pygame.K_w),
@@ -46,33 +167,86 @@ class InputHandler:
         Action.RESTART: KeyBinding(pygame.K_r, None),
         Action.QUIT: KeyBinding(pygame.K_q, None),
         Action.DEBUG_TOGGLE: KeyBinding(pygame.K_F3, None),
-    }
+    })
     
     def __init__(self, bindings: Optional[Dict[Action, KeyBinding]] = None):
         """
         Initialize the input handler.
         
         Args:
-            bindings: Custom key bindings (uses defaults if not provided)
+            bindings: Custom key bindings (uses defaults if not provided);
+                the handler keeps its own copy
         """
-        self.bindings = bindings or self.DEFAULT_BINDINGS.copy()
-        self.held_actions: Set[Action] = set()
-        self._pressed_this_frame: Set[Action] = set()
-        self._released_this_frame: Set[Action] = set()
+        self._key_to_action: Dict[int, Action]
+        self._held_keys: List[Tuple[int, int, Optional[int]]]
+        self.supported_actions: FrozenSet[Action]
+        if bindings:
+            self._bindings: Mapping[Action, KeyBinding] = MappingProxyType(dict(bindings))
+            self._rebuild_key_index()
+        else:
+            # The defaults and their lookup tables are shared until the
+            # first rebind
+            self._bindings = self.DEFAULT_BINDINGS
+            self._key_to_action, self._held_keys = _DEFAULT_KEY_INDEX
+            self.supported_actions = _DEFAULT_SUPPORTED_ACTIONS
         
-        # Callbacks for actions
-        self._callbacks: Dict[Action, Callable[[], Any]] = {}
+        # Action state as bitmasks over Action.value
+        self._held_mask = 0
+        self._pressed_mask = 0
+        self._released_mask = 0
+        self.held_actions = _ActionMaskView(self, "_held_mask")
+        self._pressed_this_frame = _ActionMaskView(self, "_pressed_mask")
+        self._released_this_frame = _ActionMaskView(self, "_released_mask")
+        
+        # Callbacks for actions, indexed by Action value; slot 0 is unused
+        self._callbacks: List[Optional[Callable[[], Any]]] = [None] * _CALLBACK_SLOTS
+    
+    @property
+    def bindings(self) -> Mapping[Action, KeyBinding]:
+        """Get the key bindings.
+        
+        The mapping is read-only, so the key lookup tables built from it
+        can never go stale; use rebind to change a binding.
+        
+        Returns:
+            Mapping of actions to key bindings.
+        """
+        return self._bindings
     
     def register_callback(self, action: Action, callback: Callable[[], Any]) -> None:
         """
         Register a callback for when an action is triggered.
         
+        Each action has one callback slot, so this replaces any callback
+        already registered for the action.
+        
         Args:
             action: The action to register for
             callback: Function to call when action is triggered
         """
         self._callbacks[action] = callback
     
+    def rebind(self, action: Action, binding: KeyBinding) -> None:
+        """
+        Change the key binding for an action.
+        
+        Args:
+            action: The action to rebind
+            binding: The new key binding
+        """
+        bindings = dict(self._bindings)
+        bindings[action] = binding
+        self._bindings = MappingProxyType(bindings)
+        self._rebuild_key_index()
+    
+    def _rebuild_key_index(self) -> None:
+        """Rebuild the key lookup tables and supported actions from the bindings.
+
+        When a key is bound to several actions, the first binding wins.
+        """
+        self._key_to_action, self._held_keys = _build_key_index(self._bindings)
+        self.supported_actions = frozenset(self._bindings)
+    
     def _get_action_for_key(self, key: int) -> Optional[Action]:
         """Get the action associated with a key.
 
@@ -82,37 +256,95 @@ class InputHandler:
         Returns:
             The Action associated with the key, or None if no binding exists.
         """
-        for action, binding in self.bindings.items():
-            if key == binding.primary or key == binding.secondary:
-                return action
-        return None
+        return self._key_to_action.get(key)
     
-    def process_events(self, events: list) -> None:
+    def begin_frame(self) -> None:
+        """Start a new input frame.
+
+        Clears the pressed and released state of the previous frame. Call
+        once per frame before feeding events to handle_event.
         """
-        Process pygame events for this frame.
+        self._pressed_mask = 0
+        self._released_mask = 0
+    
+    def handle_event(self, event: Any) -> None:
+        """
+        Apply a single pygame event to the input state.
+        
+        An action's callback runs at most once per frame: further KEYDOWN
+        events for an action already pressed this frame, e.g. key repeat
+        or its second key, only keep it held.
         
         Args:
-            events: List of pygame events
+            event: A pygame event
         """
-        self._pressed_this_frame.clear()
-        self._released_this_frame.clear()
-        
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                action = self._get_action_for_key(event.key)
-                if action:
-                    self.held_actions.add(action)
-                    self._pressed_this_frame.add(action)
+        if event.type == pygame.KEYDOWN:
+            action = self._get_action_for_key(event.key)
+            if action is not None:
+                bit = 1 << action
+                self._held_mask |= bit
+                pressed = self._pressed_mask
+                if not pressed & bit:
+                    self._pressed_mask = pressed | bit
                     
                     # Trigger callback for press-triggered actions
-                    if action in self._callbacks:
-                        self._callbacks[action]()
-                        
-            elif event.type == pygame.KEYUP:
-                action = self._get_action_for_key(event.key)
-                if action and action in self.held_actions:
-                    self.held_actions.discard(action)
-                    self._released_this_frame.add(action)
+                    callback = self._callbacks[action]
+                    if callback is not None:
+                        callback()
+                    
+        elif event.type == pygame.KEYUP:
+            action = self._get_action_for_key(event.key)
+            if action is not None and self._held_mask >> action & 1:
+                bit = 1 << action
+                self._held_mask &= ~bit
+                self._released_mask |= bit
+    
+    def sync_held(self, keys: Sequence[bool]) -> None:
+        """
+        Add the actions whose keys are down in a keyboard state snapshot.
+        
+        A KEYDOWN dropped from a full event queue leaves its action
+        unheld. Polling ``pygame.key.get_pressed()`` once per frame and
+        passing it here repairs that. The snapshot is only merged in:
+        held state from events, including posted or replayed KEYDOWNs that
+        the keyboard never saw, is kept until a KEYUP releases it. Press
+        and release edges stay event-driven.
+        
+        Args:
+            keys: Keyboard state indexed by key code, as returned by
+                pygame.key.get_pressed()
+        """
+        held = self._held_mask
+        for bit, primary, secondary in self._held_keys:
+            if keys[primary] or (secondary is not None and keys[secondary]):
+                held |= bit
+        self._held_mask = held
+    
+    def process_events(self, events: Optional[list] = None, new_frame: bool = True) -> None:
+        """
+        Process pygame events for this frame.
+        
+        Without an event list, the key events are taken straight from the
+        pygame queue in one filtered ``pygame.event.get`` call. Other
+        events, such as QUIT, stay queued for the caller.
+        
+        Presses and releases accumulate into the frame's bitmasks, so a
+        frame's events may be fed in several batches: pass
+        ``new_frame=False`` for every batch after the first, or call
+        begin_frame once and pass False for all of them.
+        
+        Args:
+            events: List of pygame events, or None to read the queue
+            new_frame: Whether to start a new frame before applying the
+                events, clearing the previous frame's presses and releases
+        """
+        if events is None:
+            events = pygame.event.get((pygame.KEYDOWN, pygame.KEYUP))
+        if new_frame:
+            self.begin_frame()
+        handle_event = self.handle_event
+        for event in events:
+            handle_event(event)
     
     def is_action_held(self, action: Action) -> bool:
         """Check if an action key is currently held.
@@ -123,7 +355,7 @@ class InputHandler:
         Returns:
             True if the action key is currently held down.
         """
-        return action in self.held_actions
+        return bool(self._held_mask >> action & 1)
     
     def is_action_pressed(self, action: Action) -> bool:
         """Check if an action was just pressed this frame.
@@ -134,7 +366,7 @@ class InputHandler:
         Returns:
             True if the action was pressed during this frame.
         """
-        return action in self._pressed_this_frame
+        return bool(self._pressed_mask >> action & 1)
     
     def is_action_released(self, action: Action) -> bool:
         """Check if an action was just released this frame.
@@ -145,7 +377,7 @@ class InputHandler:
         Returns:
             True if the action was released during this frame.
         """
-        return action in self._released_this_frame
+        return bool(self._released_mask >> action & 1)
     
     def get_movement_direction(self) -> int:
         """
@@ -154,12 +386,8 @@ class InputHandler:
         Returns:
             -1 for left, 1 for right, 0 for no movement
         """
-        direction = 0
-        if self.is_action_held(Action.MOVE_LEFT):
-            direction -= 1
-        if self.is_action_held(Action.MOVE_RIGHT):
-            direction += 1
-        return direction
+        held = self._held_mask
+        return (held >> _MOVE_RIGHT_SHIFT & 1) - (held >> _MOVE_LEFT_SHIFT & 1)
     
     def should_jump(self) -> bool:
         """Check if jump action was just pressed.
@@ -167,7 +395,7 @@ class InputHandler:
         Returns:
             True if the jump action was pressed this frame.
         """
-        return self.is_action_pressed(Action.JUMP)
+        return bool(self._pressed_mask & _JUMP_BIT)
     
     def should_flip_gravity(self) -> bool:
         """Check if gravity flip action was just pressed.
@@ -175,7 +403,7 @@ class InputHandler:
         Returns:
             True if the gravity flip action was pressed this frame.
         """
-        return self.is_action_pressed(Action.FLIP_GRAVITY)
+        return bool(self._pressed_mask & _FLIP_GRAVITY_BIT)
     
     def should_pause(self) -> bool:
         """Check if pause action was just pressed.
@@ -183,7 +411,7 @@ class InputHandler:
         Returns:
             True if the pause action was pressed this frame.
         """
-        return self.is_action_pressed(Action.PAUSE)
+        return bool(self._pressed_mask & _PAUSE_BIT)
     
     def should_restart(self) -> bool:
         """Check if restart action was just pressed.
@@ -191,7 +419,7 @@ class InputHandler:
         Returns:
             True if the restart action was pressed this frame.
         """
-        return self.is_action_pressed(Action.RESTART)
+        return bool(self._pressed_mask & _RESTART_BIT)
     
     def should_quit(self) -> bool:
         """Check if quit action was just pressed.
@@ -199,7 +427,7 @@ class InputHandler:
         Returns:
             True if the quit action was pressed this frame.
         """
-        return self.is_action_pressed(Action.QUIT)
+        return bool(self._pressed_mask & _QUIT_BIT)
     
     def should_toggle_debug(self) -> bool:
         """Check if debug toggle was just pressed.
@@ -207,13 +435,18 @@ class InputHandler:
         Returns:
             True if the debug toggle action was pressed this frame.
         """
-        return self.is_action_pressed(Action.DEBUG_TOGGLE)
+        return bool(self._pressed_mask & _DEBUG_TOGGLE_BIT)
     
     def reset(self) -> None:
         """Reset all input state.
 
         Clears all held actions and frame-specific pressed/released states.
         """
-        self.held_actions.clear()
-        self._pressed_this_frame.clear()
-        self._released_this_frame.clear()
+        self._held_mask = 0
+        self._pressed_mask = 0
+        self._released_mask = 0
+
+
+# Lookup tables for the default bindings, shared by every handler using them
+_DEFAULT_KEY_INDEX = _build_key_index(InputHandler.DEFAULT_BINDINGS)
+_DEFAULT_SUPPORTED_ACTIONS = frozenset(InputHandler.DEFAULT_BINDINGS)
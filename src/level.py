@@ -4,24 +4,89 @@ Handles level loading, management, and scrolling.
 """
 
 import json
-from typing import List, Optional, Dict, Any, Tuple
-from .platforms import Platform, MovingPlatform, GravityPlatform
-from .enemies import Enemy, Hazard
+import pygame
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterable
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to the stdlib parser
+    orjson = None
+
+from .platforms import Platform, MovingPlatform, GravityPlatform, update_moving_platforms
+from .enemies import Enemy, Hazard, update_enemies
 from .config import GameConfig, default_config
 
 
+class _IndexedList(list):
+    """
+    List of level objects that reports every change to its level.
+    
+    Level keeps x-sorted indexes built from its object lists. Each
+    mutating list operation calls ``on_change`` first, so objects added,
+    replaced or removed through the list itself, not only through the
+    level's add methods, mark the index for rebuilding.
+    """
+    
+    __slots__ = ("_on_change",)
+    
+    def __init__(self, items: Iterable[Any], on_change: Callable[[], None]):
+        """
+        Initialize the list.
+        
+        Args:
+            items: Initial contents
+            on_change: Called before every change to the list
+        """
+        super().__init__(items)
+        self._on_change = on_change
+
+
+def _notifying(name: str) -> Callable[..., Any]:
+    """Wrap a mutating list method so it calls the list's on_change first.
+
+    Args:
+        name: Name of the list method to wrap.
+
+    Returns:
+        The wrapping method.
+    """
+    method = getattr(list, name)
+    
+    def wrapper(self: _IndexedList, *args: Any, **kwargs: Any) -> Any:
+        self._on_change()
+        return method(self, *args, **kwargs)
+    
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__", "append",
+    "extend", "insert", "pop", "remove", "clear", "sort", "reverse",
+):
+    setattr(_IndexedList, _name, _notifying(_name))
+
+
 class Level:
     """
     Level container and manager.
     
     Attributes:
         platforms: List of all platforms in the level
+        gravity_platforms: The platforms that react to gravity flips
         enemies: List of all enemies
         hazards: List of all hazards
         player_spawn: Starting position for the player
         level_bounds: Tuple of (min_x, max_x, min_y, max_y)
     """
     
+    # Width in pixels of the columns of the platform broad-phase grid
+    GRID_CELL_SIZE = 256
+    
+    # Number of merged multi-column spans remembered between queries
+    GRID_SPAN_CACHE_SIZE = 64
+    
     def __init__(self, config: Optional[GameConfig] = None):
         """Initialize an empty level.
         
@@ -30,16 +95,180 @@ class Level:
         """
         self.config = config or default_config
         
+        # Set whenever the platforms, or the enemies and hazards, change;
+        # the matching index is rebuilt on the next query
+        self._platform_index_stale = True
+        self._threat_index_stale = True
+        
         self.platforms: List[Platform] = []
         self.enemies: List[Enemy] = []
         self.hazards: List[Hazard] = []
         
         self.player_spawn: Tuple[float, float] = (100, 300)
-        self.level_bounds: Tuple[float, float, float, float] = (0, 2000, 0, 600)
+        self.level_bounds = (0, 2000, 0, 600)
         
         # Camera
         self.camera_x = 0.0
         
+        # Broad-phase index: platforms sorted by the left edge of the
+        # horizontal span they can occupy
+        self._platforms_by_x: List[Platform] = []
+        self._platform_lefts: List[float] = []
+        self._platform_rects: List[pygame.Rect] = []
+        self._max_platform_span = 0.0
+        
+        # Uniform grid over x: column -> index positions of the platforms
+        # whose horizontal span touches that column
+        self._platform_grid: Dict[int, List[int]] = {}
+        
+        # Merged positions of recently queried multi-column spans
+        self._grid_span_cache: Dict[Tuple[int, int], List[int]] = {}
+        
+        # Platforms that react to gravity flips, in list order
+        self._gravity_platforms: List[GravityPlatform] = []
+        
+        # Platforms that change over time, with their positions in the
+        # index; plain static platforms are never visited per frame
+        self._moving_by_x: List[MovingPlatform] = []
+        self._moving_positions: List[int] = []
+        self._dynamic_by_x: List[Platform] = []
+        self._dynamic_positions: List[int] = []
+        
+        # Threat index: enemies sorted by the left edge of their patrol
+        # span, and static hazard rectangles sorted by their left edge
+        self._enemies_by_x: List[Enemy] = []
+        self._enemy_lefts: List[float] = []
+        self._max_enemy_span = 0.0
+        self._hazards_by_x: List[Hazard] = []
+        self._hazard_rects: List[pygame.Rect] = []
+        self._hazard_lefts: List[int] = []
+        self._max_hazard_width = 0
+        
+        # Enemies simulated by the last update (None until the first one)
+        self._active_enemies: Optional[List[Enemy]] = None
+        
+    @property
+    def level_bounds(self) -> Tuple[float, float, float, float]:
+        """Get the level bounds.
+        
+        Returns:
+            Tuple of (min_x, max_x, min_y, max_y).
+        """
+        return self._level_bounds
+    
+    @level_bounds.setter
+    def level_bounds(self, bounds: Tuple[float, float, float, float]) -> None:
+        """Set the level bounds and cache the values derived from them.
+        
+        The camera clamp and vertical limits only change with the bounds,
+        so they are computed here instead of on every frame.
+        
+        Args:
+            bounds: Tuple of (min_x, max_x, min_y, max_y).
+        """
+        self._level_bounds = bounds
+        min_x, max_x, min_y, max_y = bounds
+        window_width = self.config.window_width
+        self._camera_offset = window_width // 3
+        self._camera_min = min_x
+        self._camera_max = max_x - window_width
+        self._min_y = min_y
+        self._max_y = max_y
+    
+    @property
+    def platforms(self) -> List[Platform]:
+        """Get the list of all platforms in the level.
+        
+        Changes made through the list, or by assigning a new one, are
+        picked up by the platform index.
+        
+        Returns:
+            List[Platform]: The level's platforms.
+        """
+        return self._platforms
+    
+    @platforms.setter
+    def platforms(self, platforms: Iterable[Platform]) -> None:
+        """Replace the platforms and mark the platform index stale.
+        
+        Args:
+            platforms: The new platforms.
+        """
+        self._platforms = _IndexedList(platforms, self._invalidate_platform_index)
+        self._invalidate_platform_index()
+    
+    @property
+    def gravity_platforms(self) -> List[GravityPlatform]:
+        """Get the platforms that react to gravity flips.
+        
+        Derived from ``platforms`` with the platform index, so gravity
+        platforms placed in the list directly are included too.
+        
+        Returns:
+            List[GravityPlatform]: The gravity platforms, in the order of
+            ``platforms``. The list must not be modified.
+        """
+        if self._platform_index_stale:
+            self._rebuild_platform_index()
+        return self._gravity_platforms
+    
+    def _invalidate_platform_index(self) -> None:
+        """Mark the platform index for rebuilding on the next query."""
+        self._platform_index_stale = True
+    
+    @property
+    def enemies(self) -> List[Enemy]:
+        """Get the list of all enemies in the level.
+        
+        Changes made through the list, or by assigning a new one, are
+        picked up by the threat index.
+        
+        Returns:
+            List[Enemy]: The level's enemies.
+        """
+        return self._enemies
+    
+    @enemies.setter
+    def enemies(self, enemies: Iterable[Enemy]) -> None:
+        """Replace the enemies and mark the threat index stale.
+        
+        Args:
+            enemies: The new enemies.
+        """
+        self._enemies = _IndexedList(enemies, self._invalidate_threat_index)
+        self._invalidate_threat_index()
+    
+    @property
+    def hazards(self) -> List[Hazard]:
+        """Get the list of all hazards in the level.
+        
+        Changes made through the list, or by assigning a new one, are
+        picked up by the threat index.
+        
+        Returns:
+            List[Hazard]: The level's hazards.
+        """
+        return self._hazards
+    
+    @hazards.setter
+    def hazards(self, hazards: Iterable[Hazard]) -> None:
+        """Replace the hazards and mark the threat index stale.
+        
+        Args:
+            hazards: The new hazards.
+        """
+        self._hazards = _IndexedList(hazards, self._invalidate_threat_index)
+        self._invalidate_threat_index()
+    
+    def _invalidate_threat_index(self) -> None:
+        """Mark the enemy and hazard index for rebuilding on the next query.
+        
+        The enemies simulated by the last update are forgotten as well,
+        so hit tests never see an enemy that has been removed.
+        """
+        self._threat_index_stale = True
+        self._active_enemies = None
+    
     def add_platform(self, platform: Platform) -> None:
         """Add a platform to the level.
         
@@ -64,27 +293,329 @@ class Level:
         """
         self.hazards.append(hazard)
     
+    def _rebuild_platform_index(self) -> None:
+        """Rebuild the x-sorted platform index used for range queries.
+        
+        Also collects the gravity platforms.
+        """
+        self._platform_index_stale = False
+        self._gravity_platforms = [
+            platform for platform in self.platforms
+            if isinstance(platform, GravityPlatform)
+        ]
+        extents = [
+            (platform.get_x_extent(), platform) for platform in self.platforms
+        ]
+        extents.sort(key=lambda item: item[0][0])
+        
+        self._platforms_by_x = [platform for _, platform in extents]
+        self._platform_lefts = [left for (left, _), _ in extents]
+        self._platform_rects = [platform.rect for _, platform in extents]
+        
+        cell_size = self.GRID_CELL_SIZE
+        grid: Dict[int, List[int]] = {}
+        for position, ((left, right), _) in enumerate(extents):
+            for cell in range(int(left // cell_size), int(right // cell_size) + 1):
+                grid.setdefault(cell, []).append(position)
+        self._platform_grid = grid
+        self._grid_span_cache = {}
+        
+        self._moving_by_x = []
+        self._moving_positions = []
+        self._dynamic_by_x = []
+        self._dynamic_positions = []
+        for position, platform in enumerate(self._platforms_by_x):
+            platform_class = platform.__class__
+            if platform_class is MovingPlatform:
+                self._moving_by_x.append(platform)
+                self._moving_positions.append(position)
+            elif platform_class is not Platform:
+                self._dynamic_by_x.append(platform)
+                self._dynamic_positions.append(position)
+        self._max_platform_span = max(
+            (right - left for (left, right), _ in extents),
+            default=0.0
+        )
+    
+    def _index_range(self, min_x: float, max_x: float) -> Tuple[int, int]:
+        """
+        Get the slice of the platform index that may overlap a range.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+            
+        Returns:
+            The (start, stop) positions in the x-sorted index.
+        """
+        if self._platform_index_stale:
+            self._rebuild_platform_index()
+        
+        lefts = self._platform_lefts
+        lo = bisect_left(lefts, min_x - self._max_platform_span)
+        return lo, bisect_left(lefts, max_x, lo)
+    
+    def _grid_positions(self, min_x: float, max_x: float) -> List[int]:
+        """
+        Get the index positions of the platforms in the grid columns
+        covering a range.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+            
+        Returns:
+            Sorted positions in the x-sorted platform index.
+        """
+        if self._platform_index_stale:
+            self._rebuild_platform_index()
+        
+        cell_size = self.GRID_CELL_SIZE
+        grid = self._platform_grid
+        first = int(min_x // cell_size)
+        last = int(max_x // cell_size)
+        if first == last:
+            return grid.get(first, [])
+        
+        # Spans of several columns are merged once and remembered; the
+        # camera and the player move slowly, so the same spans recur on
+        # consecutive frames
+        key = (first, last)
+        positions = self._grid_span_cache.get(key)
+        if positions is None:
+            merged = set()
+            for cell in range(first, last + 1):
+                merged.update(grid.get(cell, ()))
+            positions = sorted(merged)
+            span_cache = self._grid_span_cache
+            if len(span_cache) >= self.GRID_SPAN_CACHE_SIZE:
+                span_cache.clear()
+            span_cache[key] = positions
+        return positions
+    
+    def get_collision_rects(self, min_x: float, max_x: float) -> List[pygame.Rect]:
+        """
+        Get the collision rectangles of the platforms near a range.
+        
+        Looks up the columns of a uniform grid over x, so the cost depends
+        on the number of platforms near the range rather than the length
+        of the level or the width of the widest platform. The result may
+        include a few platforms just outside the range. Platforms are
+        assumed not to change their horizontal span after being added;
+        the grid is rebuilt when platforms are added.
+        
+        Each platform's cached Rect comes from a list kept parallel to the
+        index, so no platform attributes are read. Rects follow the
+        platforms as they update; they must not be modified.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+            
+        Returns:
+            List of candidate platform rectangles, sorted by their left edge.
+        """
+        positions = self._grid_positions(min_x, max_x)
+        platform_rects = self._platform_rects
+        return [platform_rects[i] for i in positions]
+    
+    def visible_platforms(
+        self,
+        min_x: float,
+        max_x: float
+    ) -> List[Tuple[Platform, pygame.Rect]]:
+        """
+        Get the platforms that overlap a range, with their cached rects.
+        
+        Unlike ``get_collision_rects`` the result is exact: the grid
+        candidates are tested against the rect list kept parallel to the
+        index, so no platform attributes are read. Rects follow the
+        platforms as they update; they must not be modified.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+        
+        Returns:
+            (platform, rect) pairs, sorted by the platforms' left edge.
+        """
+        positions = self._grid_positions(min_x, max_x)
+        platforms_by_x = self._platforms_by_x
+        platform_rects = self._platform_rects
+        visible = []
+        for i in positions:
+            rect = platform_rects[i]
+            if rect.right >= min_x and rect.left <= max_x:
+                visible.append((platforms_by_x[i], rect))
+        return visible
+    
     def update(self, player_x: float) -> None:
         """
         Update all level objects.
         
+        Objects far outside the view are frozen: platforms are updated
+        within two screen widths of the view and enemies within one, so
+        every simulated enemy still sees all platforms it can touch. Both
+        are found through the x-sorted indexes rather than a scan of
+        every object in the level.
+        
         Args:
             player_x: Player x position for camera following
         """
         # Update camera to follow player
-        target_camera = player_x - self.config.window_width // 3
-        self.camera_x = max(
-            self.level_bounds[0],
-            min(target_camera, self.level_bounds[1] - self.config.window_width)
+        target_camera = player_x - self._camera_offset
+        self.camera_x = max(self._camera_min, min(target_camera, self._camera_max))
+        
+        view_left = self.camera_x
+        view_right = view_left + self.config.window_width
+        margin = self.config.window_width
+        
+        # Update the dynamic platforms near the view; static ones are
+        # skipped entirely
+        lo, hi = self._index_range(
+            view_left - 2 * margin,
+            view_right + 2 * margin
         )
         
-        # Update platforms
-        for platform in self.platforms:
+        positions = self._moving_positions
+        start = bisect_left(positions, lo)
+        update_moving_platforms(
+            self._moving_by_x[start:bisect_left(positions, hi, start)]
+        )
+        
+        positions = self._dynamic_positions
+        start = bisect_left(positions, lo)
+        for platform in self._dynamic_by_x[start:bisect_left(positions, hi, start)]:
             platform.update()
         
-        # Update enemies
-        for enemy in self.enemies:
-            enemy.update(self.platforms)
+        # Update enemies near the view; the index narrows the candidates
+        # to those whose patrol span reaches the window
+        enemy_left = view_left - margin
+        enemy_right = view_right + margin
+        if self._threat_index_stale:
+            self._rebuild_threat_index()
+        lefts = self._enemy_lefts
+        enemy_lo = bisect_left(lefts, enemy_left - self._max_enemy_span)
+        enemy_hi = bisect_right(lefts, enemy_right, enemy_lo)
+        active_enemies = [
+            enemy for enemy in self._enemies_by_x[enemy_lo:enemy_hi]
+            if enemy_left < enemy.x < enemy_right
+        ]
+        update_enemies(active_enemies, self._platform_rects[lo:hi])
+        self._active_enemies = active_enemies
+    
+    def _rebuild_threat_index(self) -> None:
+        """Rebuild the x-sorted enemy and hazard indexes used for range queries."""
+        self._threat_index_stale = False
+        extents = [(enemy.get_x_extent(), enemy) for enemy in self.enemies]
+        extents.sort(key=lambda item: item[0][0])
+        self._enemies_by_x = [enemy for _, enemy in extents]
+        self._enemy_lefts = [left for (left, _), _ in extents]
+        self._max_enemy_span = max(
+            (right - left for (left, right), _ in extents),
+            default=0.0
+        )
+        
+        # Hazards never move, so their rectangles are collected once
+        self._hazards_by_x = sorted(self.hazards, key=lambda hazard: hazard.rect.left)
+        hazard_rects = [hazard.rect for hazard in self._hazards_by_x]
+        self._hazard_rects = hazard_rects
+        self._hazard_lefts = [rect.left for rect in hazard_rects]
+        self._max_hazard_width = max(
+            (rect.width for rect in hazard_rects),
+            default=0
+        )
+    
+    def _threat_ranges(self, min_x: float, max_x: float) -> Tuple[int, int, int, int]:
+        """
+        Get the slices of the enemy and hazard indexes that may overlap a range.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+        
+        Returns:
+            The (start, stop) positions in the enemy index followed by
+            those in the hazard index.
+        """
+        if self._threat_index_stale:
+            self._rebuild_threat_index()
+        
+        lefts = self._enemy_lefts
+        enemy_lo = bisect_left(lefts, min_x - self._max_enemy_span)
+        enemy_hi = bisect_right(lefts, max_x, enemy_lo)
+        
+        lefts = self._hazard_lefts
+        hazard_lo = bisect_left(lefts, min_x - self._max_hazard_width)
+        hazard_hi = bisect_right(lefts, max_x, hazard_lo)
+        return enemy_lo, enemy_hi, hazard_lo, hazard_hi
+    
+    def enemies_in_range(self, min_x: float, max_x: float) -> List[Enemy]:
+        """
+        Get the enemies whose patrol span may overlap a range.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+        
+        Returns:
+            List of candidate enemies, sorted by the left edge of their
+            patrol span.
+        """
+        lo, hi, _, _ = self._threat_ranges(min_x, max_x)
+        return self._enemies_by_x[lo:hi]
+    
+    def hazards_in_range(self, min_x: float, max_x: float) -> List[Hazard]:
+        """
+        Get the hazards that may overlap a range.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+        
+        Returns:
+            List of candidate hazards, sorted by their left edge.
+        """
+        _, _, lo, hi = self._threat_ranges(min_x, max_x)
+        return self._hazards_by_x[lo:hi]
+    
+    def get_threat_rects(
+        self,
+        min_x: Optional[float] = None,
+        max_x: Optional[float] = None
+    ) -> List[pygame.Rect]:
+        """Get the collision rectangles of everything that hurts the player.
+        
+        Enemies and hazards are combined into one list so a single
+        ``collidelist`` call can test the player against all of them.
+        
+        Given a range, only the enemies whose patrol span and the hazards
+        whose rectangle may overlap it are returned, found by bisecting
+        the x-sorted indexes. Without one, once the level has been updated
+        only the enemies simulated near the view are included; the player
+        is always in view, so frozen enemies further away cannot reach it.
+        
+        Args:
+            min_x: Left edge of the range in world coordinates
+            max_x: Right edge of the range in world coordinates
+        
+        Returns:
+            Enemy rectangles followed by hazard rectangles.
+        """
+        if min_x is None or max_x is None:
+            if self._threat_index_stale:
+                self._rebuild_threat_index()
+            enemies = self._active_enemies
+            if enemies is None:
+                enemies = self.enemies
+            threat_rects = [enemy.rect for enemy in enemies]
+            threat_rects.extend(self._hazard_rects)
+            return threat_rects
+        
+        enemy_lo, enemy_hi, hazard_lo, hazard_hi = self._threat_ranges(min_x, max_x)
+        threat_rects = [enemy.rect for enemy in self._enemies_by_x[enemy_lo:enemy_hi]]
+        threat_rects.extend(self._hazard_rects[hazard_lo:hazard_hi])
+        return threat_rects
     
     def set_gravity_for_all(self, direction: int) -> None:
         """
@@ -96,9 +627,8 @@ class Level:
         for enemy in self.enemies:
             enemy.set_gravity(direction)
         
-        for platform in self.platforms:
-            if isinstance(platform, GravityPlatform):
-                platform.set_gravity(direction)
+        for platform in self.gravity_platforms:
+            platform.set_gravity(direction)
     
     def reset(self) -> None:
         """Reset all level objects to initial state.
@@ -108,9 +638,8 @@ class Level:
         """
         self.camera_x = 0
         
-        for platform in self.platforms:
-            if isinstance(platform, GravityPlatform):
-                platform.reset()
+        for platform in self.gravity_platforms:
+            platform.reset()
         
         # Enemies would need spawn position tracking for full reset
     
@@ -130,13 +659,41 @@ class Level:
         Returns:
             True if player is outside vertical bounds, False otherwise.
         """
-        min_x, max_x, min_y, max_y = self.level_bounds
         return (
-            player_y > max_y + player_height or
-            player_y < min_y - player_height
+            player_y > self._max_y + player_height or
+            player_y < self._min_y - player_height
         )
 
 
+def _build_static_platform(p: Dict[str, Any], config: GameConfig) -> Platform:
+    """Build a static platform from its JSON data."""
+    return Platform(p['x'], p['y'], p['width'], p['height'], config=config)
+
+
+def _build_moving_platform(p: Dict[str, Any], config: GameConfig) -> Platform:
+    """Build a moving platform from its JSON data."""
+    return MovingPlatform(
+        p['x'], p['y'], p['width'], p['height'],
+        p.get('end_x', p['x']),
+        p.get('end_y', p['y']),
+        p.get('speed', 2.0),
+        config=config
+    )
+
+
+def _build_gravity_platform(p: Dict[str, Any], config: GameConfig) -> Platform:
+    """Build a gravity platform from its JSON data."""
+    return GravityPlatform(p['x'], p['y'], p['width'], p['height'], config=config)
+
+
+# Platform builders keyed by the 'type' field of the level JSON
+_PLATFORM_BUILDERS: Dict[str, Callable[[Dict[str, Any], GameConfig], Platform]] = {
+    'static': _build_static_platform,
+    'moving': _build_moving_platform,
+    'gravity': _build_gravity_platform,
+}
+
+
 class LevelLoader:
     """Utility class for loading levels from various sources."""
     
@@ -209,7 +766,8 @@ class LevelLoader:
         """Load a level from a JSON file.
         
         Parses a JSON file containing level data including bounds, spawn point,
-        platforms (static, moving, gravity), enemies, and hazards.
+        platforms (static, moving, gravity), enemies, and hazards. Uses
+        orjson when it is installed and the stdlib json module otherwise.
         
         Args:
             filepath: Path to the JSON level file.
@@ -224,8 +782,9 @@ class LevelLoader:
         """
         config = config or default_config
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         level = Level(config)
         
@@ -235,28 +794,10 @@ class LevelLoader:
         if 'spawn' in data:
             level.player_spawn = tuple(data['spawn'])
         
-        # Load platforms
+        # Load platforms, dispatching on type (unknown types are static)
         for p in data.get('platforms', []):
-            platform_type = p.get('type', 'static')
-            
-            if platform_type == 'moving':
-                level.add_platform(MovingPlatform(
-                    p['x'], p['y'], p['width'], p['height'],
-                    p.get('end_x', p['x']),
-                    p.get('end_y', p['y']),
-                    p.get('speed', 2.0),
-                    config=config
-                ))
-            elif platform_type == 'gravity':
-                level.add_platform(GravityPlatform(
-                    p['x'], p['y'], p['width'], p['height'],
-                    config=config
-                ))
-            else:
-                level.add_platform(Platform(
-                    p['x'], p['y'], p['width'], p['height'],
-                    config=config
-                ))
+            build = _PLATFORM_BUILDERS.get(p.get('type'), _build_static_platform)
+            level.add_platform(build(p, config))
         
         # Load enemies
         for e in data.get('enemies', []):
@@ -284,6 +825,7 @@ class LevelLoader:
         
         Serializes the level data including bounds, spawn point, platforms,
         enemies, and hazards to a JSON file with pretty-printed formatting.
+        Uses orjson when it is installed and the stdlib json module otherwise.
         
         Args:
             level: The Level object to save.
@@ -338,5 +880,9 @@ class LevelLoader:
                 'height': hazard.height
             })
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
@@ -4,7 +4,7 @@ Contains platform classes for level construction.
 """
 
 import pygame
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from .config import GameConfig, default_config
 
 
@@ -19,6 +19,8 @@ class Platform:
         height: Platform height
     """
     
+    __slots__ = ("config", "x", "y", "width", "height", "color", "_rect")
+    
     def __init__(
         self,
         x: float,
@@ -46,14 +48,26 @@ class Platform:
         self.height = height
         self.color = color or self.config.platform_color
         
+        # Collision rectangle, reused and updated in place
+        self._rect = pygame.Rect(int(x), int(y), width, height)
+        
     @property
     def rect(self) -> pygame.Rect:
         """Get the platform's collision rectangle.
 
+        The same Rect instance is returned on every access and refreshed
+        from the current position, so callers must not keep it across
+        frames or modify it.
+
         Returns:
             pygame.Rect: The platform's bounding rectangle for collision detection.
         """
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        self._sync_rect()
+        return self._rect
+    
+    def _sync_rect(self) -> None:
+        """Refresh the cached collision rectangle from the position."""
+        self._rect.update(int(self.x), int(self.y), self.width, self.height)
     
     def update(self) -> None:
         """Update platform state.
@@ -62,6 +76,14 @@ class Platform:
         """
         pass
     
+    def get_x_extent(self) -> Tuple[float, float]:
+        """Get the horizontal span the platform can ever occupy.
+
+        Returns:
+            Tuple[float, float]: The (left, right) world x coordinates.
+        """
+        return self.x, self.x + self.width
+    
     def get_render_rect(self, camera_x: float = 0) -> pygame.Rect:
         """Get rectangle adjusted for camera position.
 
@@ -77,6 +99,32 @@ class Platform:
             self.width,
             self.height
         )
+    
+    def fill_render_rect(self, rect: pygame.Rect, camera_x: float = 0) -> pygame.Rect:
+        """Write the camera-adjusted rectangle into an existing Rect.
+
+        Same result as ``get_render_rect`` without allocating a new Rect.
+
+        Args:
+            rect: Rect to overwrite.
+            camera_x: The camera's horizontal offset for scrolling.
+
+        Returns:
+            pygame.Rect: The given rect, now in screen coordinates.
+        """
+        rect.update(int(self.x - camera_x), int(self.y), self.width, self.height)
+        return rect
+    
+    def draw_decoration(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw the markings that set this platform type apart.
+
+        Plain platforms have none.
+
+        Args:
+            screen: Surface to draw on.
+            rect: The platform's rectangle on that surface.
+        """
+        pass
 
 
 class MovingPlatform(Platform):
@@ -90,6 +138,11 @@ class MovingPlatform(Platform):
         direction: Current movement direction (1 or -1)
     """
     
+    __slots__ = (
+        "start_x", "start_y", "end_x", "end_y", "speed", "progress", "direction",
+        "_span_x", "_span_y", "_step",
+    )
+    
     def __init__(
         self,
         x: float,
@@ -126,13 +179,18 @@ class MovingPlatform(Platform):
         self.progress = 0.0  # 0 to 1, position between start and end
         self.direction = 1  # 1 = toward end, -1 = toward start
         
+        # Path constants, fixed for the platform's lifetime
+        self._span_x = end_x - x
+        self._span_y = end_y - y
+        self._step = speed * 0.01  # Progress per frame
+        
     def update(self) -> None:
         """Update platform position.
 
         Moves the platform along its path between start and end points,
         reversing direction when reaching either endpoint.
         """
-        self.progress += self.speed * self.direction * 0.01
+        self.progress += self._step * self.direction
         
         # Reverse direction at endpoints
         if self.progress >= 1.0:
@@ -143,8 +201,19 @@ class MovingPlatform(Platform):
             self.direction = 1
         
         # Interpolate position
-        self.x = self.start_x + (self.end_x - self.start_x) * self.progress
-        self.y = self.start_y + (self.end_y - self.start_y) * self.progress
+        self.x = self.start_x + self._span_x * self.progress
+        self.y = self.start_y + self._span_y * self.progress
+        self._sync_rect()
+    
+    def get_x_extent(self) -> Tuple[float, float]:
+        """Get the horizontal span the platform sweeps along its path.
+
+        Returns:
+            Tuple[float, float]: The (left, right) world x coordinates.
+        """
+        left = min(self.start_x, self.end_x)
+        right = max(self.start_x, self.end_x) + self.width
+        return left, right
     
     def get_velocity(self) -> Tuple[float, float]:
         """Get current velocity for player riding.
@@ -152,9 +221,51 @@ class MovingPlatform(Platform):
         Returns:
             Tuple[float, float]: The (dx, dy) velocity vector of the platform.
         """
-        dx = (self.end_x - self.start_x) * self.speed * self.direction * 0.01
-        dy = (self.end_y - self.start_y) * self.speed * self.direction * 0.01
-        return dx, dy
+        step = self._step * self.direction
+        return self._span_x * step, self._span_y * step
+    
+    def draw_decoration(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw the moving platform border.
+
+        Args:
+            screen: Surface to draw on.
+            rect: The platform's rectangle on that surface.
+        """
+        # Draw movement indicators
+        pygame.draw.rect(screen, (150, 150, 170), rect, 2)
+
+
+def update_moving_platforms(platforms: List[MovingPlatform]) -> None:
+    """
+    Update every moving platform in a single batched pass.
+    
+    Equivalent to calling ``MovingPlatform.update`` on each platform, but
+    the progress step, endpoint bounce and interpolation run in one loop
+    over local variables, saving a method call per platform per frame.
+    
+    Args:
+        platforms: Moving platforms to update
+    """
+    for platform in platforms:
+        direction = platform.direction
+        progress = platform.progress + platform._step * direction
+        
+        # Reverse direction at endpoints
+        if progress >= 1.0:
+            progress = 1.0
+            direction = -1
+        elif progress <= 0.0:
+            progress = 0.0
+            direction = 1
+        
+        # Interpolate position
+        x = platform.start_x + platform._span_x * progress
+        y = platform.start_y + platform._span_y * progress
+        platform._rect.update(int(x), int(y), platform.width, platform.height)
+        platform.x = x
+        platform.y = y
+        platform.progress = progress
+        platform.direction = direction
 
 
 class GravityPlatform(Platform):
@@ -163,6 +274,8 @@ class GravityPlatform(Platform):
     Falls in the direction of gravity when activated.
     """
     
+    __slots__ = ("dy", "gravity_direction", "is_falling", "original_y")
+    
     def __init__(
         self,
         x: float,
@@ -206,6 +319,7 @@ class GravityPlatform(Platform):
         if self.is_falling:
             self.dy += self.config.gravity_strength * self.gravity_direction * 0.5
             self.y += self.dy
+            self._sync_rect()
     
     def reset(self) -> None:
         """Reset platform to original position.
@@ -216,3 +330,14 @@ class GravityPlatform(Platform):
         self.dy = 0
         self.is_falling = False
         self.gravity_direction = 1
+        self._sync_rect()
+    
+    def draw_decoration(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw the gravity platform border.
+
+        Args:
+            screen: Surface to draw on.
+            rect: The platform's rectangle on that surface.
+        """
+        # Draw gravity icon
+        pygame.draw.rect(screen, (100, 150, 200), rect, 2)
@@ -21,6 +21,12 @@ class Player:
         on_ground: Whether player is standing on a surface
     """
     
+    __slots__ = (
+        "config", "x", "y", "spawn_x", "spawn_y", "dx", "dy",
+        "on_ground", "width", "height", "facing_right", "is_moving", "_rect",
+        "_gravity_direction", "_signed_gravity",
+    )
+    
     def __init__(
         self,
         x: float,
@@ -59,14 +65,42 @@ class Player:
         self.facing_right = True
         self.is_moving = False
         
+        # Collision rectangle, reused and updated in place
+        self._rect = pygame.Rect(int(x), int(y), self.width, self.height)
+        
     @property
     def rect(self) -> pygame.Rect:
         """Get the player's collision rectangle.
         
+        The same Rect instance is returned on every access and refreshed
+        from the current position, so callers must not keep it across
+        frames or modify it.
+        
         Returns:
             pygame.Rect: A rectangle representing the player's collision bounds.
         """
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        rect = self._rect
+        rect.update(int(self.x), int(self.y), self.width, self.height)
+        return rect
+    
+    @property
+    def gravity_direction(self) -> int:
+        """Get the gravity direction (1 for normal, -1 for inverted).
+        
+        Returns:
+            int: The current gravity direction.
+        """
+        return self._gravity_direction
+    
+    @gravity_direction.setter
+    def gravity_direction(self, direction: int) -> None:
+        """Set the gravity direction and cache the signed gravity.
+        
+        Args:
+            direction: Gravity direction (1 for normal, -1 for inverted).
+        """
+        self._gravity_direction = direction
+        self._signed_gravity = self.config.gravity_strength * direction
     
     def move(self, direction: int) -> None:
         """
@@ -113,14 +147,15 @@ class Player:
         gravity direction. The fall speed is clamped to prevent excessive
         velocities.
         """
-        self.dy += self.config.gravity_strength * self.gravity_direction
+        gravity_direction = self._gravity_direction
+        dy = self.dy + self._signed_gravity
         
-        # Clamp fall speed
+        # Clamp fall speed; multiplying by the direction folds both
+        # gravity cases into a single comparison
         max_speed = self.config.max_fall_speed
-        if self.gravity_direction > 0:
-            self.dy = min(self.dy, max_speed)
-        else:
-            self.dy = max(self.dy, -max_speed)
+        if dy * gravity_direction > max_speed:
+            dy = max_speed * gravity_direction
+        self.dy = dy
     
     def update(self, platforms: List["Platform"]) -> None:
         """
@@ -129,65 +164,63 @@ class Player:
         Args:
             platforms: List of platforms to check collisions against
         """
-        self.apply_gravity()
-        
-        # Update horizontal position
-        self.x += self.dx
-        self._check_horizontal_collisions(platforms)
-        
-        # Update vertical position
-        self.y += self.dy
-        self._check_vertical_collisions(platforms)
+        self.update_with_rects([platform.rect for platform in platforms])
     
-    def _check_horizontal_collisions(self, platforms: List["Platform"]) -> None:
-        """Check and resolve horizontal collisions with platforms.
+    def update_with_rects(self, platform_rects: List[pygame.Rect]) -> None:
+        """
+        Update player position against precomputed platform rectangles.
         
-        Detects collisions between the player and platforms on the horizontal
-        axis and adjusts the player's position to prevent overlap.
+        Gravity comes from ``apply_gravity``; movement and both collision
+        passes then run as one fused step over local variables, and the
+        player's state is written back once. The same rectangles are shared
+        by the horizontal and vertical collision passes. When several
+        platforms overlap on an axis, the player snaps to the surface it
+        reached first.
         
         Args:
-            platforms: List of platforms to check collisions against.
+            platform_rects: Collision rectangles of the platforms to check
         """
-        player_rect = self.rect
+        # Gravity with clamped fall speed
+        self.apply_gravity()
+        dy = self.dy
+        gravity_direction = self._gravity_direction
+        width = self.width
+        height = self.height
+        rect = self._rect
         
-        for platform in platforms:
-            if player_rect.colliderect(platform.rect):
-                if self.dx > 0:  # Moving right
-                    self.x = platform.rect.left - self.width
-                elif self.dx < 0:  # Moving left
-                    self.x = platform.rect.right
-    
-    def _check_vertical_collisions(self, platforms: List["Platform"]) -> None:
-        """Check and resolve vertical collisions with platforms.
+        # Horizontal movement: stop at the first edge reached
+        dx = self.dx
+        x = self.x + dx
+        y = self.y
+        if dx:
+            rect.update(int(x), int(y), width, height)
+            hits = rect.collidelistall(platform_rects)
+            if hits:
+                if dx > 0:  # Moving right
+                    x = min([platform_rects[i].left for i in hits]) - width
+                else:  # Moving left
+                    x = max([platform_rects[i].right for i in hits])
         
-        Detects collisions between the player and platforms on the vertical
-        axis, adjusts the player's position, and updates the on_ground state.
-        Handles both normal and inverted gravity scenarios.
+        # Vertical movement: snap to the highest top when moving down, the
+        # lowest bottom when moving up
+        y += dy
+        on_ground = False
+        if dy:
+            rect.update(int(x), int(y), width, height)
+            hits = rect.collidelistall(platform_rects)
+            if hits:
+                if dy > 0:
+                    y = min([platform_rects[i].top for i in hits]) - height
+                else:
+                    y = max([platform_rects[i].bottom for i in hits])
+                # Landing when moving with gravity, bumping when against it
+                on_ground = dy * gravity_direction > 0
+                dy = 0
         
-        Args:
-            platforms: List of platforms to check collisions against.
-        """
-        player_rect = self.rect
-        self.on_ground = False
-        
-        for platform in platforms:
-            if player_rect.colliderect(platform.rect):
-                if self.gravity_direction > 0:  # Normal gravity
-                    if self.dy > 0:  # Falling down
-                        self.y = platform.rect.top - self.height
-                        self.dy = 0
-                        self.on_ground = True
-                    elif self.dy < 0:  # Moving up
-                        self.y = platform.rect.bottom
-                        self.dy = 0
-                else:  # Inverted gravity
-                    if self.dy < 0:  # Falling up
-                        self.y = platform.rect.bottom
-                        self.dy = 0
-                        self.on_ground = True
-                    elif self.dy > 0:  # Moving down
-                        self.y = platform.rect.top - self.height
-                        self.dy = 0
+        self.x = x
+        self.y = y
+        self.dy = dy
+        self.on_ground = on_ground
     
     def check_enemy_collision(self, enemies: List["Enemy"]) -> bool:
         """
@@ -199,11 +232,7 @@ class Player:
         Returns:
             True if colliding with any enemy, False otherwise
         """
-        player_rect = self.rect
-        for enemy in enemies:
-            if player_rect.colliderect(enemy.rect):
-                return True
-        return False
+        return self.rect.collidelist([enemy.rect for enemy in enemies]) != -1
     
     def check_hazard_collision(self, hazards: List["Hazard"]) -> bool:
         """
@@ -215,11 +244,7 @@ class Player:
         Returns:
             True if colliding with any hazard, False otherwise
         """
-        player_rect = self.rect
-        for hazard in hazards:
-            if player_rect.colliderect(hazard.rect):
-                return True
-        return False
+        return self.rect.collidelist([hazard.rect for hazard in hazards]) != -1
     
     def reset(self) -> None:
         """Reset player to spawn position.
@@ -4,10 +4,11 @@ Handles all drawing operations.
 """
 
 import pygame
-from typing import Optional, List, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, List, Tuple, Union
 from .config import GameConfig, default_config
 from .player import Player
-from .platforms import Platform, MovingPlatform, GravityPlatform
+from .platforms import Platform
 from .enemies import Enemy, Hazard
 from .level import Level
 
@@ -21,6 +22,12 @@ class Renderer:
         config: Game configuration
     """
     
+    # Number of rendered text surfaces kept by the text cache
+    TEXT_CACHE_SIZE = 128
+    
+    # Room above and below the player body for the gravity arrow
+    PLAYER_SPRITE_MARGIN = 16
+    
     def __init__(
         self,
         screen: pygame.Surface,
@@ -42,7 +49,78 @@ class Renderer:
             ((25, 25, 45), 0.3),   # Mid background
             ((30, 30, 50), 0.5),   # Near background
         ]
+        self._bg_surface = self._bake_background()
+        
+        # Fonts are loaded once; loading one is far too slow to do per frame
+        self._font_ui = pygame.font.Font(None, 36)
+        self._font_debug = pygame.font.Font(None, 24)
+        self._font_big = pygame.font.Font(None, 72)
+        
+        # Overlay layers and text never change, so they are rendered once
+        # up front
+        self._game_over_overlay = self._make_dim_overlay(150)
+        self._pause_overlay = self._make_dim_overlay(100)
+        center_x = self.config.window_width // 2
+        center_y = self.config.window_height // 2
+        self._game_over_text = self._font_big.render("GAME OVER", True, (255, 50, 50))
+        self._game_over_pos = self._game_over_text.get_rect(center=(center_x, center_y - 30))
+        self._restart_text = self._font_ui.render("Press R to restart", True, (255, 255, 255))
+        self._restart_pos = self._restart_text.get_rect(center=(center_x, center_y + 30))
+        self._pause_text = self._font_big.render("PAUSED", True, (255, 255, 255))
+        self._pause_pos = self._pause_text.get_rect(center=(center_x, center_y))
+        
+        # Scratch rects reused by the single-object draw methods; drawing
+        # calls do not keep the rect, so reusing one per type is safe
+        self._scratch_platform_rect = pygame.Rect(0, 0, 0, 0)
+        self._scratch_enemy_rect = pygame.Rect(0, 0, 0, 0)
+        self._scratch_hazard_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Pre-rendered player variants, keyed by size, color, facing and
+        # whether gravity points down
+        self._player_sprites: Dict[tuple, pygame.Surface] = {}
+        
+        # Pre-rendered platforms, keyed by (type, width, height, color)
+        self._platform_sprites: Dict[tuple, pygame.Surface] = {}
+        
+        # Pre-rendered enemies, keyed by size, color and whether gravity
+        # points down
+        self._enemy_sprites: Dict[tuple, pygame.Surface] = {}
+        
+        # Pre-rendered hazards, keyed by (width, height, color)
+        self._hazard_sprites: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Least recently used cache of rendered dynamic text, keyed by
+        # (text, color, font id)
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        
+        # Debug overlay lines, kept with the rounded player state they show
+        self._debug_state: Optional[tuple] = None
+        self._debug_surfaces: List[pygame.Surface] = []
+        
+        # Screen regions drawn this frame and last frame, used by present()
+        # when dirty rect updates are enabled; the first frame is shown whole
+        self._dirty_rects: List[pygame.Rect] = []
+        self._previous_dirty_rects: List[pygame.Rect] = [screen.get_rect()]
+    
+    def _make_dim_overlay(self, alpha: int) -> pygame.Surface:
+        """
+        Create a screen-sized black layer that dims everything below it.
         
+        Args:
+            alpha: Opacity of the layer, from 0 to 255
+        
+        Returns:
+            The overlay surface.
+        """
+        overlay = pygame.Surface(
+            (self.config.window_width, self.config.window_height),
+            0,
+            self.screen
+        )
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        return overlay
+    
     def clear(self) -> None:
         """Clear the screen with background color.
 
@@ -51,24 +129,63 @@ class Renderer:
         """
         self.screen.fill(self.config.background_color)
     
+    def _mark_dirty(self, rect: Union[pygame.Rect, Tuple[int, int, int, int]]) -> None:
+        """Record a screen region that changed this frame.
+        
+        Nothing is recorded unless dirty rect updates are enabled.
+        
+        Args:
+            rect: Region of the screen that was drawn to.
+        """
+        if self.config.dirty_rect_updates:
+            self._dirty_rects.append(pygame.Rect(rect))
+    
+    def present(self) -> None:
+        """Show the finished frame on the display.
+        
+        With ``dirty_rect_updates`` enabled only the regions drawn this
+        frame and last frame are sent to the display: the backdrop is the
+        same on every frame, so everything else is already up to date,
+        and last frame's regions cover the objects that have since moved
+        away. Otherwise the whole display is flipped.
+        """
+        if self.config.dirty_rect_updates:
+            pygame.display.update(self._previous_dirty_rects + self._dirty_rects)
+            self._previous_dirty_rects = self._dirty_rects
+            self._dirty_rects = []
+        else:
+            pygame.display.flip()
+    
+    def _bake_background(self) -> pygame.Surface:
+        """
+        Render the background layers into one screen-sized surface.
+        
+        The layers are solid horizontal bands that span the whole width,
+        so scrolling them never changes a pixel and they can be drawn once.
+        
+        Returns:
+            The pre-rendered background surface.
+        """
+        width = self.config.window_width
+        height = self.config.window_height
+        surface = pygame.Surface((width, height), 0, self.screen)
+        surface.fill(self.config.background_color)
+        
+        layer_height = height // len(self.bg_layers)
+        for i, (color, _) in enumerate(self.bg_layers):
+            surface.fill(color, (0, i * layer_height, width, layer_height))
+        return surface
+    
     def draw_background(self, camera_x: float = 0) -> None:
         """
         Draw parallax background layers.
         
+        The layers are pre-rendered, so this is a single blit.
+        
         Args:
             camera_x: Current camera x position
         """
-        height = self.config.window_height
-        layer_height = height // len(self.bg_layers)
-        
-        for i, (color, scroll_factor) in enumerate(self.bg_layers):
-            # Create parallax offset
-            offset = int(camera_x * scroll_factor) % self.config.window_width
-            
-            # Draw layer
-            y = i * layer_height
-            rect = pygame.Rect(0, y, self.config.window_width, layer_height)
-            self.screen.fill(color, rect)
+        self.screen.blit(self._bg_surface, (0, 0))
     
     def draw_player(
         self,
@@ -86,52 +203,82 @@ class Renderer:
         screen_x = int(player.x - camera_x)
         screen_y = int(player.y)
         
-        # Draw player body
-        player_rect = pygame.Rect(
-            screen_x, screen_y,
-            player.width, player.height
+        self._mark_dirty(self.screen.blit(
+            self._get_player_sprite(player),
+            (screen_x, screen_y - self.PLAYER_SPRITE_MARGIN)
+        ))
+        
+        # Debug hitbox
+        if self.config.show_hitboxes:
+            pygame.draw.rect(
+                self.screen,
+                (255, 255, 0),
+                (screen_x, screen_y, player.width, player.height),
+                1
+            )
+    
+    def _get_player_sprite(self, player: Player) -> pygame.Surface:
+        """
+        Get the pre-rendered body, eyes and gravity arrow of the player.
+        
+        The player's look only varies with facing and gravity direction,
+        so each variant is rendered once. The sprite extends
+        ``PLAYER_SPRITE_MARGIN`` pixels above and below the body to fit
+        the gravity arrow.
+        
+        Args:
+            player: Player to get the sprite for
+        
+        Returns:
+            The player sprite, which must not be modified.
+        """
+        key = (
+            player.width,
+            player.height,
+            player.config.player_color,
+            player.facing_right,
+            player.gravity_direction > 0
         )
-        pygame.draw.rect(self.screen, player.config.player_color, player_rect)
+        sprite = self._player_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        
+        width, height, color, facing_right, gravity_down = key
+        margin = self.PLAYER_SPRITE_MARGIN
+        sprite = pygame.Surface((width, height + 2 * margin), pygame.SRCALPHA)
+        
+        # Draw player body
+        sprite.fill(color, (0, margin, width, height))
         
         # Draw direction indicator (eyes/facing)
         eye_size = 6
-        eye_y = screen_y + 8 if player.gravity_direction > 0 else screen_y + player.height - 14
-        
-        if player.facing_right:
-            eye_x = screen_x + player.width - 12
-        else:
-            eye_x = screen_x + 6
+        eye_y = margin + 8 if gravity_down else margin + height - 14
+        eye_x = width - 12 if facing_right else 6
         
+        pygame.draw.circle(sprite, (255, 255, 255), (eye_x, eye_y), eye_size)
         pygame.draw.circle(
-            self.screen,
-            (255, 255, 255),
-            (eye_x, eye_y),
-            eye_size
-        )
-        pygame.draw.circle(
-            self.screen,
+            sprite,
             (0, 0, 0),
-            (eye_x + (2 if player.facing_right else -2), eye_y),
+            (eye_x + (2 if facing_right else -2), eye_y),
             eye_size // 2
         )
         
         # Draw gravity indicator
-        indicator_y = screen_y + player.height + 5 if player.gravity_direction > 0 else screen_y - 10
-        arrow_dir = 1 if player.gravity_direction > 0 else -1
+        indicator_y = margin + height + 5 if gravity_down else margin - 10
+        arrow_dir = 1 if gravity_down else -1
         
         pygame.draw.polygon(
-            self.screen,
+            sprite,
             (200, 200, 255),
             [
-                (screen_x + player.width // 2, indicator_y + 5 * arrow_dir),
-                (screen_x + player.width // 2 - 5, indicator_y - 5 * arrow_dir),
-                (screen_x + player.width // 2 + 5, indicator_y - 5 * arrow_dir),
+                (width // 2, indicator_y + 5 * arrow_dir),
+                (width // 2 - 5, indicator_y - 5 * arrow_dir),
+                (width // 2 + 5, indicator_y - 5 * arrow_dir),
             ]
         )
         
-        # Debug hitbox
-        if self.config.show_hitboxes:
-            pygame.draw.rect(self.screen, (255, 255, 0), player_rect, 1)
+        self._player_sprites[key] = sprite
+        return sprite
     
     def draw_platform(
         self,
@@ -145,26 +292,46 @@ class Renderer:
             platform: Platform object to draw
             camera_x: Camera x position
         """
-        render_rect = platform.get_render_rect(camera_x)
+        render_rect = platform.fill_render_rect(self._scratch_platform_rect, camera_x)
         
         # Skip if off screen
-        if render_rect.right < 0 or render_rect.left > self.config.window_width:
+        if not self._is_on_screen(render_rect):
             return
         
-        pygame.draw.rect(self.screen, platform.color, render_rect)
-        
-        # Add visual distinction for special platforms
-        if isinstance(platform, MovingPlatform):
-            # Draw movement indicators
-            pygame.draw.rect(self.screen, (150, 150, 170), render_rect, 2)
-        elif isinstance(platform, GravityPlatform):
-            # Draw gravity icon
-            pygame.draw.rect(self.screen, (100, 150, 200), render_rect, 2)
+        self._mark_dirty(self.screen.blit(self._get_platform_sprite(platform), render_rect))
         
         # Debug hitbox
         if self.config.show_hitboxes:
             pygame.draw.rect(self.screen, (0, 255, 0), render_rect, 1)
     
+    def _get_platform_sprite(self, platform: Platform) -> pygame.Surface:
+        """
+        Get the pre-rendered body and border of a platform.
+        
+        A platform's look depends only on its type, size and color, so
+        each distinct combination is rendered once and shared.
+        
+        Args:
+            platform: Platform to get the sprite for
+        
+        Returns:
+            The platform sprite, which must not be modified.
+        """
+        key = (platform.__class__, platform.width, platform.height, platform.color)
+        sprite = self._platform_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        
+        _, width, height, color = key
+        sprite = pygame.Surface((width, height), 0, self.screen)
+        sprite.fill(color)
+        
+        # Add visual distinction for special platforms
+        platform.draw_decoration(sprite, sprite.get_rect())
+        
+        self._platform_sprites[key] = sprite
+        return sprite
+    
     def draw_enemy(
         self,
         enemy: Enemy,
@@ -177,34 +344,49 @@ class Renderer:
             enemy: Enemy object to draw
             camera_x: Camera x position
         """
-        render_rect = enemy.get_render_rect(camera_x)
+        render_rect = enemy.fill_render_rect(self._scratch_enemy_rect, camera_x)
         
         # Skip if off screen
-        if render_rect.right < 0 or render_rect.left > self.config.window_width:
+        if not self._is_on_screen(render_rect):
             return
         
-        pygame.draw.rect(self.screen, enemy.color, render_rect)
+        self._mark_dirty(self.screen.blit(self._get_enemy_sprite(enemy), render_rect))
+        
+        # Debug hitbox
+        if self.config.show_hitboxes:
+            pygame.draw.rect(self.screen, (255, 0, 0), render_rect, 1)
+    
+    def _get_enemy_sprite(self, enemy: Enemy) -> pygame.Surface:
+        """
+        Get the pre-rendered body and eyes of an enemy.
+        
+        An enemy's look depends only on its size, color and whether
+        gravity points down, so each variant is rendered once and shared.
+        
+        Args:
+            enemy: Enemy to get the sprite for
+        
+        Returns:
+            The enemy sprite, which must not be modified.
+        """
+        key = (enemy.width, enemy.height, enemy.color, enemy.gravity_direction > 0)
+        sprite = self._enemy_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        
+        width, height, color, gravity_down = key
+        sprite = pygame.Surface((width, height), 0, self.screen)
+        sprite.fill(color)
         
         # Draw angry eyes
         eye_size = 4
-        eye_y = render_rect.y + 8 if enemy.gravity_direction > 0 else render_rect.y + enemy.height - 12
+        eye_y = 8 if gravity_down else height - 12
         
-        pygame.draw.circle(
-            self.screen,
-            (255, 255, 255),
-            (render_rect.x + 8, eye_y),
-            eye_size
-        )
-        pygame.draw.circle(
-            self.screen,
-            (255, 255, 255),
-            (render_rect.x + enemy.width - 8, eye_y),
-            eye_size
-        )
+        pygame.draw.circle(sprite, (255, 255, 255), (8, eye_y), eye_size)
+        pygame.draw.circle(sprite, (255, 255, 255), (width - 8, eye_y), eye_size)
         
-        # Debug hitbox
-        if self.config.show_hitboxes:
-            pygame.draw.rect(self.screen, (255, 0, 0), render_rect, 1)
+        self._enemy_sprites[key] = sprite
+        return sprite
     
     def draw_hazard(
         self,
@@ -218,37 +400,73 @@ class Renderer:
             hazard: Hazard object to draw
             camera_x: Camera x position
         """
-        render_rect = hazard.get_render_rect(camera_x)
+        render_rect = hazard.fill_render_rect(self._scratch_hazard_rect, camera_x)
         
         # Skip if off screen
-        if render_rect.right < 0 or render_rect.left > self.config.window_width:
+        if not self._is_on_screen(render_rect):
             return
         
-        # Draw spiky hazard
-        pygame.draw.rect(self.screen, hazard.color, render_rect)
-        
-        # Draw spike triangles
-        spike_count = render_rect.width // 10
-        for i in range(spike_count):
-            spike_x = render_rect.x + i * 10 + 5
-            pygame.draw.polygon(
-                self.screen,
-                (255, 50, 0),
-                [
-                    (spike_x, render_rect.y),
-                    (spike_x - 5, render_rect.y + render_rect.height),
-                    (spike_x + 5, render_rect.y + render_rect.height),
-                ]
-            )
+        self._mark_dirty(self.screen.blit(self._get_hazard_sprite(hazard), render_rect))
         
         # Debug hitbox
         if self.config.show_hitboxes:
             pygame.draw.rect(self.screen, (255, 128, 0), render_rect, 1)
     
+    def _get_hazard_sprite(self, hazard: Hazard) -> pygame.Surface:
+        """
+        Get the pre-rendered body and spikes of a hazard.
+        
+        A hazard's look depends only on its size and color, so each
+        distinct combination is rendered once and shared.
+        
+        Args:
+            hazard: Hazard to get the sprite for
+        
+        Returns:
+            The hazard sprite, which must not be modified.
+        """
+        key = (hazard.width, hazard.height, hazard.color)
+        sprite = self._hazard_sprites.get(key)
+        if sprite is None:
+            width, height, color = key
+            sprite = pygame.Surface((width, height), 0, self.screen)
+            sprite.fill(color)
+            
+            # Draw the spike triangles as one zig-zag polygon; neighbouring
+            # spikes share their base corners, so the outline runs tip,
+            # base, tip, ... along the row
+            spike_count = width // 10
+            if spike_count:
+                points = [(0, height)]
+                for i in range(spike_count):
+                    points.append((i * 10 + 5, 0))
+                    points.append((i * 10 + 10, height))
+                pygame.draw.polygon(sprite, (255, 50, 0), points)
+            self._hazard_sprites[key] = sprite
+        return sprite
+    
+    def _is_on_screen(self, render_rect: Union[pygame.Rect, Tuple[int, int, int, int]]) -> bool:
+        """
+        Check whether a screen-space rectangle overlaps the window horizontally.
+        
+        Args:
+            render_rect: Screen-space Rect or ``(x, y, width, height)`` tuple
+        
+        Returns:
+            True if any part of the rectangle can be visible.
+        """
+        left = render_rect[0]
+        return left + render_rect[2] >= 0 and left <= self.config.window_width
+    
     def draw_level(self, level: Level) -> None:
         """
         Draw all level elements.
         
+        Every object is drawn from a pre-rendered sprite, and the sprites
+        of all visible objects are submitted in a single ``blits`` call.
+        Layers keep their order, platforms first, then hazards, then
+        enemies.
+        
         Args:
             level: Level object containing all game objects
         """
@@ -257,17 +475,88 @@ class Renderer:
         # Draw background
         self.draw_background(camera_x)
         
-        # Draw platforms
-        for platform in level.platforms:
-            self.draw_platform(platform, camera_x)
+        # Only objects near the view are visited; platforms are culled
+        # exactly by the level, while the enemy and hazard range queries
+        # may return a few just off screen, which the exact test drops
+        view_right = camera_x + self.config.window_width
+        
+        # Collect the visible objects' sprites in z-order: platforms,
+        # then hazards, then enemies
+        blits = []
+        get_platform_sprite = self._get_platform_sprite
+        for platform, rect in level.visible_platforms(camera_x, view_right):
+            # Screen x comes from the float position, like every other
+            # object, so fractional platforms and cameras do not jitter
+            blits.append((
+                get_platform_sprite(platform),
+                (int(platform.x - camera_x), rect.y, rect.width, rect.height)
+            ))
+        platforms_end = len(blits)
+        
+        self._collect_visible_blits(
+            level.hazards_in_range(camera_x, view_right),
+            self._get_hazard_sprite, camera_x, blits
+        )
+        hazards_end = len(blits)
+        
+        self._collect_visible_blits(
+            level.enemies_in_range(camera_x, view_right),
+            self._get_enemy_sprite, camera_x, blits
+        )
+        
+        # Submit every sprite in one call
+        self.screen.blits(blits, False)
+        if self.config.dirty_rect_updates:
+            self._dirty_rects.extend(pygame.Rect(render_rect) for _, render_rect in blits)
+        
+        # Debug hitboxes
+        if self.config.show_hitboxes:
+            self._draw_hitboxes(blits, platforms_end, hazards_end)
+    
+    def _collect_visible_blits(
+        self,
+        objects: List[Union[Enemy, Hazard]],
+        get_sprite: Callable[[Union[Enemy, Hazard]], pygame.Surface],
+        camera_x: float,
+        blits: List[Tuple[pygame.Surface, Tuple[int, int, int, int]]]
+    ) -> None:
+        """
+        Append the sprites of the on-screen objects to a blit list.
         
-        # Draw hazards
-        for hazard in level.hazards:
-            self.draw_hazard(hazard, camera_x)
+        Args:
+            objects: Enemies or hazards near the view
+            get_sprite: Sprite lookup for the kind of object
+            camera_x: The camera's X offset for scrolling
+            blits: (sprite, screen rect) pairs to append to
+        """
+        is_on_screen = self._is_on_screen
+        for obj in objects:
+            render_rect = (int(obj.x - camera_x), int(obj.y), obj.width, obj.height)
+            if is_on_screen(render_rect):
+                blits.append((get_sprite(obj), render_rect))
+    
+    def _draw_hitboxes(
+        self,
+        blits: List[Tuple[pygame.Surface, Tuple[int, int, int, int]]],
+        platforms_end: int,
+        hazards_end: int
+    ) -> None:
+        """
+        Outline every drawn object, colored by its layer.
         
-        # Draw enemies
-        for enemy in level.enemies:
-            self.draw_enemy(enemy, camera_x)
+        Args:
+            blits: The (sprite, screen rect) pairs drawn this frame
+            platforms_end: Number of leading platform entries
+            hazards_end: End position of the hazard entries
+        """
+        for i, (_, render_rect) in enumerate(blits):
+            if i < platforms_end:
+                color = (0, 255, 0)
+            elif i < hazards_end:
+                color = (255, 128, 0)
+            else:
+                color = (255, 0, 0)
+            pygame.draw.rect(self.screen, color, render_rect, 1)
     
     def draw_ui(
         self,
@@ -283,32 +572,81 @@ class Renderer:
             score: Current score
             lives: Remaining lives
         """
-        font = pygame.font.Font(None, 36)
+        font = self._font_ui
         
         # Lives
-        lives_text = font.render(f"Lives: {lives}", True, (255, 255, 255))
-        self.screen.blit(lives_text, (10, 10))
+        lives_text = self._render_text(font, f"Lives: {lives}", (255, 255, 255))
+        self._mark_dirty(self.screen.blit(lives_text, (10, 10)))
         
         # Score
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 45))
+        score_text = self._render_text(font, f"Score: {score}", (255, 255, 255))
+        self._mark_dirty(self.screen.blit(score_text, (10, 45)))
         
         # Gravity indicator
         gravity_str = "Normal" if player.gravity_direction > 0 else "Inverted"
-        gravity_text = font.render(f"Gravity: {gravity_str}", True, (200, 200, 255))
-        self.screen.blit(gravity_text, (self.config.window_width - 180, 10))
+        gravity_text = self._render_text(font, f"Gravity: {gravity_str}", (200, 200, 255))
+        self._mark_dirty(self.screen.blit(gravity_text, (self.config.window_width - 180, 10)))
         
         # Debug info
         if self.config.debug_mode:
-            debug_font = pygame.font.Font(None, 24)
-            debug_lines = [
-                f"Pos: ({player.x:.1f}, {player.y:.1f})",
-                f"Vel: ({player.dx:.1f}, {player.dy:.1f})",
-                f"On Ground: {player.on_ground}",
-            ]
-            for i, line in enumerate(debug_lines):
-                text = debug_font.render(line, True, (200, 200, 200))
-                self.screen.blit(text, (10, self.config.window_height - 80 + i * 20))
+            # The lines show one decimal place, so they only need
+            # formatting and rendering again when the rounded state
+            # changes. They bypass the text cache, since the ever-changing
+            # values would only evict the stable UI strings from it.
+            state = (
+                round(player.x, 1), round(player.y, 1),
+                round(player.dx, 1), round(player.dy, 1),
+                player.on_ground,
+            )
+            if state != self._debug_state:
+                x, y, dx, dy, on_ground = state
+                debug_font = self._font_debug
+                debug_lines = [
+                    f"Pos: ({x:.1f}, {y:.1f})",
+                    f"Vel: ({dx:.1f}, {dy:.1f})",
+                    f"On Ground: {on_ground}",
+                ]
+                self._debug_state = state
+                self._debug_surfaces = [
+                    debug_font.render(line, True, (200, 200, 200)) for line in debug_lines
+                ]
+            for i, text in enumerate(self._debug_surfaces):
+                self._mark_dirty(
+                    self.screen.blit(text, (10, self.config.window_height - 80 + i * 20))
+                )
+    
+    def _render_text(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """
+        Render text through the least recently used text cache.
+        
+        UI strings rarely change between frames, so most calls are a
+        dictionary lookup instead of a glyph rasterization.
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: RGB text color
+        
+        Returns:
+            The rendered text surface, which must not be modified.
+        """
+        cache = self._text_cache
+        key = (text, color, id(font))
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        cache[key] = surface
+        if len(cache) > self.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
     
     def draw_game_over(self) -> None:
         """Draw the game over screen.
@@ -316,29 +654,12 @@ class Renderer:
         Renders a semi-transparent overlay with "GAME OVER" text and
         a restart prompt centered on the screen.
         """
-        # Dim overlay
-        overlay = pygame.Surface((self.config.window_width, self.config.window_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(150)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        font = pygame.font.Font(None, 72)
-        text = font.render("GAME OVER", True, (255, 50, 50))
-        text_rect = text.get_rect(center=(
-            self.config.window_width // 2,
-            self.config.window_height // 2 - 30
-        ))
-        self.screen.blit(text, text_rect)
-        
-        # Restart prompt
-        small_font = pygame.font.Font(None, 36)
-        restart_text = small_font.render("Press R to restart", True, (255, 255, 255))
-        restart_rect = restart_text.get_rect(center=(
-            self.config.window_width // 2,
-            self.config.window_height // 2 + 30
-        ))
-        self.screen.blit(restart_text, restart_rect)
+        # Dim overlay; it covers the whole screen
+        self._mark_dirty(self.screen.blit(self._game_over_overlay, (0, 0)))
+        
+        # Game over text and restart prompt
+        self.screen.blit(self._game_over_text, self._game_over_pos)
+        self.screen.blit(self._restart_text, self._restart_pos)
     
     def draw_pause(self) -> None:
         """Draw the pause overlay.
@@ -346,17 +667,8 @@ class Renderer:
         Renders a semi-transparent overlay with "PAUSED" text centered
         on the screen to indicate the game is paused.
         """
-        # Dim overlay
-        overlay = pygame.Surface((self.config.window_width, self.config.window_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(100)
-        self.screen.blit(overlay, (0, 0))
+        # Dim overlay; it covers the whole screen
+        self._mark_dirty(self.screen.blit(self._pause_overlay, (0, 0)))
         
         # Pause text
-        font = pygame.font.Font(None, 72)
-        text = font.render("PAUSED", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(
-            self.config.window_width // 2,
-            self.config.window_height // 2
-        ))
-        self.screen.blit(text, text_rect)
+        self.screen.blit(self._pause_text, self._pause_pos)
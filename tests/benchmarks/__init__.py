@@ -0,0 +1,3 @@
+"""
+Benchmarks for Gravity Flip Runner's per-frame hot paths.
+"""
@@ -0,0 +1,23 @@
+"""
+Pytest configuration for the benchmarks.
+
+Benchmarks are skipped unless pytest runs with ``--benchmark-only``, so
+a plain ``pytest tests/`` run stays fast.
+"""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they were explicitly requested.
+
+    Args:
+        config: The pytest configuration.
+        items: Collected test items.
+    """
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
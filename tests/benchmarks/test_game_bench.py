@@ -0,0 +1,70 @@
+"""
+Benchmarks for the game's per-frame work.
+"""
+
+import pytest
+
+from src.game import Game, GameState
+from src.config import GameConfig
+
+# The benchmark fixture comes from pytest-benchmark, a dev-only dependency
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def game():
+    """Create one game instance shared by every benchmark in this module.
+
+    Returns:
+        Game: A configured game instance with 800x600 resolution at 60 FPS.
+    """
+    return Game(GameConfig(window_width=800, window_height=600, fps=60))
+
+
+@pytest.fixture(autouse=True)
+def settled_game(game):
+    """Restart the game and let the player land before each benchmark.
+
+    Args:
+        game: The shared game fixture instance.
+
+    Yields:
+        Game: The game, running with the player resting at spawn.
+    """
+    game.restart()
+    for _ in range(120):
+        game.update()
+    yield game
+    
+    # A benchmark that lost every life would have measured an idle update
+    assert game.state == GameState.RUNNING
+
+
+def test_update_bench(benchmark, game):
+    """Benchmark one frame of game logic.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        game: The shared game fixture instance.
+    """
+    benchmark(game.update)
+
+
+def test_check_collisions_bench(benchmark, game):
+    """Benchmark the player's threat and bounds collision checks.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        game: The shared game fixture instance.
+    """
+    benchmark(game._check_collisions)
+
+
+def test_render_bench(benchmark, game):
+    """Benchmark drawing and presenting one frame.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        game: The shared game fixture instance.
+    """
+    benchmark(game.render)
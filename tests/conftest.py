@@ -7,13 +7,39 @@ import sys
 import os
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-# Set dummy video driver for headless testing
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+# Set dummy video driver for headless testing. SDL reads these when a
+# pygame subsystem is initialized, not when pygame is imported; conftest
+# is loaded before any test module, so every init sees them. They are
+# assigned rather than defaulted so a desktop session's driver never wins;
+# test modules do not need to set them
 os.environ['SDL_VIDEODRIVER'] = 'dummy'
 os.environ['SDL_AUDIODRIVER'] = 'dummy'
 
 
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Initialize pygame once for the whole test session.
+
+    Fixtures must not call ``pygame.quit()``; tearing every SDL subsystem
+    down and bringing it back up is the most expensive step a test can
+    take. A test that needs a fresh window can call
+    ``pygame.display.set_mode`` again instead. Under ``pytest -n`` each
+    worker is its own process with its own SDL state and window, so
+    workers never share a display.
+
+    Yields:
+        None
+    """
+    import pygame
+    pygame.init()
+    yield
+    pygame.quit()
+
+
 @pytest.fixture
 def config():
     """Provide a default GameConfig for tests.
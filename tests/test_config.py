@@ -4,24 +4,39 @@ Tests for the config module.
 
 import pytest
 import os
+import sys
 from src.config import GameConfig, default_config
 
 
+@pytest.fixture(scope="module")
+def defaults():
+    """Provide one default GameConfig shared by the read-only tests.
+
+    Returns:
+        GameConfig: A GameConfig instance with default settings.
+    """
+    return GameConfig()
+
+
 class TestGameConfig:
     """Tests for GameConfig class."""
     
-    def test_default_values(self):
+    def test_default_values(self, defaults):
         """Test that default configuration has expected values.
 
-        Creates a default GameConfig instance and verifies all default
-        values are set correctly for window dimensions, FPS, player
-        physics, and debug settings.
+        Verifies all default values are set correctly for window
+        dimensions, FPS, player physics, and debug settings.
+
+        Args:
+            defaults: Shared default configuration.
         """
-        config = GameConfig()
+        config = defaults
         
         assert config.window_width == 800
         assert config.window_height == 600
         assert config.fps == 60
+        assert config.hardware_display is False
+        assert config.dirty_rect_updates is False
         assert config.player_speed == 5.0
         assert config.player_jump_force == 15.0
         assert config.gravity_strength == 0.8
@@ -59,8 +74,9 @@ class TestGameConfig:
             monkeypatch: Pytest fixture for modifying environment variables.
         """
         # Clear relevant env vars
-        for var in ['WINDOW_WIDTH', 'WINDOW_HEIGHT', 'FPS', 'PLAYER_SPEED', 
-                    'PLAYER_JUMP_FORCE', 'GRAVITY_STRENGTH', 'DEBUG_MODE', 'SHOW_HITBOXES']:
+        for var in ['WINDOW_WIDTH', 'WINDOW_HEIGHT', 'FPS', 'HARDWARE_DISPLAY',
+                    'DIRTY_RECT_UPDATES', 'PLAYER_SPEED', 'PLAYER_JUMP_FORCE',
+                    'GRAVITY_STRENGTH', 'DEBUG_MODE', 'SHOW_HITBOXES']:
             monkeypatch.delenv(var, raising=False)
         
         config = GameConfig.from_env()
@@ -69,7 +85,27 @@ class TestGameConfig:
         assert config.window_height == 600
         assert config.fps == 60
     
-    def test_from_env_custom(self, monkeypatch):
+    @pytest.mark.parametrize("env, expected", [
+        (
+            {'WINDOW_WIDTH': '1920', 'WINDOW_HEIGHT': '1080', 'FPS': '120'},
+            {'window_width': 1920, 'window_height': 1080, 'fps': 120},
+        ),
+        (
+            {'PLAYER_SPEED': '8.0', 'PLAYER_JUMP_FORCE': '12.5', 'GRAVITY_STRENGTH': '1.2'},
+            {'player_speed': 8.0, 'player_jump_force': 12.5, 'gravity_strength': 1.2},
+        ),
+        (
+            {'HARDWARE_DISPLAY': 'true', 'DIRTY_RECT_UPDATES': 'true',
+             'DEBUG_MODE': 'true', 'SHOW_HITBOXES': 'TRUE'},
+            {'hardware_display': True, 'dirty_rect_updates': True,
+             'debug_mode': True, 'show_hitboxes': True},
+        ),
+        (
+            {'DEBUG_MODE': 'False', 'SHOW_HITBOXES': 'no'},
+            {'debug_mode': False, 'show_hitboxes': False},
+        ),
+    ])
+    def test_from_env_custom(self, monkeypatch, env, expected):
         """Test configuration from environment with custom values.
 
         Sets custom environment variables and verifies that from_env()
@@ -78,22 +114,16 @@ class TestGameConfig:
 
         Args:
             monkeypatch: Pytest fixture for modifying environment variables.
+            env: Environment variables to set.
+            expected: Expected configuration attribute values.
         """
-        monkeypatch.setenv('WINDOW_WIDTH', '1920')
-        monkeypatch.setenv('WINDOW_HEIGHT', '1080')
-        monkeypatch.setenv('FPS', '120')
-        monkeypatch.setenv('PLAYER_SPEED', '8.0')
-        monkeypatch.setenv('DEBUG_MODE', 'true')
-        monkeypatch.setenv('SHOW_HITBOXES', 'TRUE')
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
         
         config = GameConfig.from_env()
         
-        assert config.window_width == 1920
-        assert config.window_height == 1080
-        assert config.fps == 120
-        assert config.player_speed == 8.0
-        assert config.debug_mode is True
-        assert config.show_hitboxes is True
+        for attr, value in expected.items():
+            assert getattr(config, attr) == value, attr
     
     def test_default_config_instance(self):
         """Test the default_config singleton.
@@ -105,14 +135,17 @@ class TestGameConfig:
         assert isinstance(default_config, GameConfig)
         assert default_config.window_width == 800
     
-    def test_colors_are_tuples(self):
+    def test_colors_are_tuples(self, defaults):
         """Test that color values are proper RGB tuples.
 
         Verifies that all color configuration values are tuples with
         exactly 3 elements, and that background_color values are valid
         RGB values (0-255 range).
+
+        Args:
+            defaults: Shared default configuration.
         """
-        config = GameConfig()
+        config = defaults
         
         assert isinstance(config.background_color, tuple)
         assert len(config.background_color) == 3
@@ -123,27 +156,46 @@ class TestGameConfig:
         assert isinstance(config.enemy_color, tuple)
         assert isinstance(config.hazard_color, tuple)
     
-    def test_player_dimensions(self):
+    def test_player_dimensions(self, defaults):
         """Test player dimension defaults.
 
         Verifies that player width and height have the expected default
         values and are positive integers.
+
+        Args:
+            defaults: Shared default configuration.
         """
-        config = GameConfig()
+        config = defaults
         
         assert config.player_width == 32
         assert config.player_height == 48
         assert config.player_width > 0
         assert config.player_height > 0
     
-    def test_physics_values(self):
+    def test_physics_values(self, defaults):
         """Test physics configuration values.
 
         Verifies that physics-related configuration values (gravity,
         max fall speed, jump force) are all positive numbers.
+
+        Args:
+            defaults: Shared default configuration.
         """
-        config = GameConfig()
+        config = defaults
         
         assert config.gravity_strength > 0
         assert config.max_fall_speed > 0
         assert config.player_jump_force > 0
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="requires slotted dataclasses")
+    def test_slotted_and_mutable(self):
+        """Test configuration uses slots but still allows runtime toggles.
+
+        Verifies that instances have no __dict__ and that the debug flags
+        can still be changed after construction.
+        """
+        config = GameConfig()
+        
+        assert not hasattr(config, '__dict__')
+        config.debug_mode = True
+        assert config.debug_mode is True
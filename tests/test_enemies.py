@@ -3,11 +3,38 @@ Tests for the enemies module.
 """
 
 import pytest
-from src.enemies import Enemy, Hazard
+import pygame
+from src.enemies import Enemy, Hazard, update_enemies
 from src.platforms import Platform
 from src.config import GameConfig
 
 
+@pytest.fixture(scope="module")
+def shared_config():
+    """Provide a default GameConfig shared by tests that never modify it.
+
+    Returns:
+        GameConfig: A GameConfig instance with default settings.
+    """
+    return GameConfig()
+
+
+@pytest.fixture(scope="module")
+def shared_platform(shared_config):
+    """Provide a static ground platform shared by the enemy collision tests.
+
+    Static platforms never change once built, so one instance serves
+    every test in the module.
+
+    Args:
+        shared_config: The shared configuration.
+
+    Returns:
+        Platform: A Platform instance at (150, 500) with size 200x50.
+    """
+    return Platform(150, 500, 200, 50, config=shared_config)
+
+
 class TestEnemy:
     """Tests for Enemy class."""
     
@@ -79,6 +106,19 @@ class TestEnemy:
         assert rect.width == 32
         assert rect.height == 32
     
+    def test_rect_tracks_position(self, enemy):
+        """Test the cached rect is reused and follows the enemy.
+
+        Args:
+            enemy: Enemy fixture with default configuration.
+        """
+        rect = enemy.rect
+        enemy.x = 250.7
+        enemy.y = 300.2
+        
+        assert enemy.rect is rect
+        assert (rect.x, rect.y) == (250, 300)
+    
     def test_set_gravity(self, enemy):
         """Test setting gravity direction.
 
@@ -90,6 +130,16 @@ class TestEnemy:
         assert enemy.gravity_direction == -1
         assert enemy.on_ground is False
     
+    def test_get_x_extent_covers_patrol(self, config):
+        """Test the x extent spans the whole patrol plus one step.
+
+        Args:
+            config: Game configuration fixture.
+        """
+        enemy = Enemy(100, 0, patrol_distance=50, speed=2.0, config=config)
+        
+        assert enemy.get_x_extent() == (48, 184)
+    
     def test_apply_gravity(self, enemy):
         """Test gravity application increases downward velocity.
 
@@ -113,6 +163,18 @@ class TestEnemy:
         
         assert enemy.dy < 0
     
+    def test_apply_gravity_inverted_clamped(self, enemy):
+        """Test inverted gravity clamps at negative max fall speed.
+
+        Args:
+            enemy: Enemy fixture with default configuration.
+        """
+        enemy.set_gravity(-1)
+        enemy.dy = -enemy.config.max_fall_speed
+        enemy.apply_gravity()
+        
+        assert enemy.dy == -enemy.config.max_fall_speed
+    
     def test_apply_gravity_clamped(self, enemy):
         """Test gravity clamps at max fall speed.
 
@@ -142,7 +204,7 @@ class TestEnemy:
             enemy: Enemy fixture with default configuration.
         """
         enemy.x = enemy.start_x + enemy.patrol_distance + 1
-        enemy._patrol()
+        enemy.update([])
         
         assert enemy.direction == -1
     
@@ -153,18 +215,18 @@ class TestEnemy:
             enemy: Enemy fixture with default configuration.
         """
         enemy.x = enemy.start_x - enemy.patrol_distance - 1
-        enemy._patrol()
+        enemy.update([])
         
         assert enemy.direction == 1
     
-    def test_collision_with_platform(self, enemy, config):
+    def test_collision_with_platform(self, enemy, shared_platform):
         """Test enemy lands on platform.
 
         Args:
             enemy: Enemy fixture with default configuration.
-            config: Game configuration fixture.
+            shared_platform: Shared ground platform.
         """
-        platform = Platform(150, 500, 200, 50, config=config)
+        platform = shared_platform
         enemy.y = 460
         enemy.dy = 10
         
@@ -174,6 +236,41 @@ class TestEnemy:
         assert enemy.dy == 0
         assert enemy.on_ground is True
     
+    def test_collision_inverted_gravity(self, enemy, config):
+        """Test enemy lands on a ceiling platform with inverted gravity.
+
+        Args:
+            enemy: Enemy fixture with default configuration.
+            config: Game configuration fixture.
+        """
+        ceiling = Platform(150, 400, 200, 50, config=config)
+        enemy.set_gravity(-1)
+        enemy.y = 445
+        enemy.dy = -10
+        
+        enemy.update([Platform(0, 0, 50, 50, config=config), ceiling])
+        
+        assert enemy.y == ceiling.rect.bottom
+        assert enemy.dy == 0
+        assert enemy.on_ground is True
+    
+    def test_collision_against_gravity_not_grounded(self, enemy, config):
+        """Test hitting a platform while moving against gravity.
+
+        Args:
+            enemy: Enemy fixture with default configuration.
+            config: Game configuration fixture.
+        """
+        ceiling = Platform(150, 400, 200, 50, config=config)
+        enemy.y = 460
+        enemy.dy = -15
+        
+        enemy.update([ceiling])
+        
+        assert enemy.y == ceiling.rect.bottom
+        assert enemy.dy == 0
+        assert enemy.on_ground is False
+    
     def test_get_render_rect_no_camera(self, enemy):
         """Test render rect without camera offset.
 
@@ -196,6 +293,41 @@ class TestEnemy:
         
         assert render_rect.x == enemy.x - camera_x
         assert render_rect.y == enemy.y
+    
+    def test_fill_render_rect(self, enemy):
+        """Test filling an existing rect matches get_render_rect.
+
+        Args:
+            enemy: Enemy fixture with default configuration.
+        """
+        rect = pygame.Rect(0, 0, 0, 0)
+        
+        result = enemy.fill_render_rect(rect, 100)
+        
+        assert result is rect
+        assert rect == enemy.get_render_rect(100)
+
+
+class TestUpdateEnemies:
+    """Tests for the batched update_enemies function."""
+    
+    def test_empty_list(self):
+        """Test updating an empty enemy list is a no-op."""
+        update_enemies([], [])
+    
+    def test_uses_enemy_config(self, shared_platform):
+        """Test each enemy falls with the gravity of its own config.
+
+        Args:
+            shared_platform: Shared ground platform.
+        """
+        enemy = Enemy(200, 100, config=GameConfig(gravity_strength=2.0, max_fall_speed=3.0))
+        
+        update_enemies([enemy], [shared_platform.rect])
+        assert enemy.dy == 2.0
+        
+        update_enemies([enemy], [shared_platform.rect])
+        assert enemy.dy == 3.0
 
 
 class TestHazard:
@@ -233,6 +365,22 @@ class TestHazard:
         
         assert hazard.color == custom_color
     
+    @pytest.mark.parametrize("attr", ["x", "y", "width", "height"])
+    def test_position_and_size_read_only(self, hazard, attr):
+        """Test a hazard cannot be moved or resized after construction.
+
+        Args:
+            hazard: Hazard fixture with default configuration.
+            attr: Name of the position or size attribute.
+
+        Verifies that assigning raises instead of leaving the collision
+        rectangle out of date.
+        """
+        with pytest.raises(AttributeError):
+            setattr(hazard, attr, 900)
+        
+        assert hazard.rect == (300, 550, 50, 20)
+    
     def test_rect_property(self, hazard):
         """Test rect property returns correct pygame.Rect.
 
@@ -246,6 +394,14 @@ class TestHazard:
         assert rect.width == 50
         assert rect.height == 20
     
+    def test_rect_is_built_once(self, hazard):
+        """Test the static hazard returns the same rect every time.
+
+        Args:
+            hazard: Hazard fixture with default configuration.
+        """
+        assert hazard.rect is hazard.rect
+    
     def test_get_render_rect_no_camera(self, hazard):
         """Test render rect without camera offset.
 
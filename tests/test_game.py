@@ -3,17 +3,15 @@ Tests for the game module.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch, PropertyMock
 import pygame
 
 from src.game import Game, GameState
 from src.config import GameConfig
-
-
-# Set dummy drivers before pygame init
-import os
-os.environ['SDL_VIDEODRIVER'] = 'dummy'
-os.environ['SDL_AUDIODRIVER'] = 'dummy'
+from src.enemies import Enemy, Hazard
+from src.input_handler import Action
+from src.level import Level
 
 
 class TestGameState:
@@ -30,27 +28,162 @@ class TestGameState:
         assert GameState.GAME_OVER
 
 
+@pytest.fixture(scope="module")
+def game():
+    """Create one game instance shared by every test in this module.
+
+    Building a Game opens a display and loads the level, so it is done
+    once; TestGame resets the game's state before each test instead.
+    pygame itself stays up for the whole session.
+
+    Returns:
+        Game: A configured game instance with 800x600 resolution at 60 FPS.
+    """
+    config = GameConfig(
+        window_width=800,
+        window_height=600,
+        fps=60
+    )
+    return Game(config)
+
+
+@pytest.fixture
+def game_stub():
+    """Create a stand-in for Game with only the attributes its logic reads.
+
+    The real Game methods are called on it unbound, so state transitions
+    can be tested without opening a display or building a level.
+
+    Returns:
+        SimpleNamespace: A stub with fresh game state and mocked components.
+    """
+    return SimpleNamespace(
+        config=GameConfig(),
+        lives=3,
+        score=0,
+        _max_x=0.0,
+        state=GameState.RUNNING,
+        running=True,
+        player=MagicMock(spawn_x=0, spawn_y=0, dx=0),
+        level=MagicMock(player_spawn=(0, 0)),
+        renderer=MagicMock(),
+        input_handler=MagicMock(held_actions=set()),
+        _init_game_objects=MagicMock(),
+    )
+
+
+class TestGameLogic:
+    """Tests for Game state transitions, run against a stub game."""
+    
+    def test_restart_resets_state(self, game_stub):
+        """Test restart resets game state.
+
+        Args:
+            game_stub: The stub game fixture.
+
+        Verifies that calling restart() resets lives to 3, score to 0,
+        state to RUNNING, and rebuilds the game objects.
+        """
+        game_stub.lives = 1
+        game_stub.score = 500
+        game_stub.state = GameState.GAME_OVER
+        
+        Game.restart(game_stub)
+        
+        assert game_stub.lives == 3
+        assert game_stub.score == 0
+        assert game_stub.state == GameState.RUNNING
+        game_stub._init_game_objects.assert_called_once()
+    
+    def test_player_hit_decreases_lives(self, game_stub):
+        """Test player hit decreases lives.
+
+        Args:
+            game_stub: The stub game fixture.
+
+        Verifies that _player_hit() decrements the lives counter by one.
+        """
+        Game._player_hit(game_stub)
+        
+        assert game_stub.lives == 2
+    
+    def test_player_hit_game_over(self, game_stub):
+        """Test player hit causes game over at 0 lives.
+
+        Args:
+            game_stub: The stub game fixture.
+
+        Verifies that _player_hit() triggers GAME_OVER state when lives reach 0.
+        """
+        game_stub.lives = 1
+        
+        Game._player_hit(game_stub)
+        
+        assert game_stub.lives == 0
+        assert game_stub.state == GameState.GAME_OVER
+        game_stub.player.reset.assert_not_called()
+    
+    def test_player_hit_resets_player(self, game_stub):
+        """Test player hit resets the player and level.
+
+        Args:
+            game_stub: The stub game fixture.
+
+        Verifies that _player_hit() sends the player back to spawn and
+        resets the level while lives remain.
+        """
+        Game._player_hit(game_stub)
+        
+        game_stub.player.reset.assert_called_once()
+        game_stub.level.reset.assert_called_once()
+    
+    @pytest.mark.parametrize("state", [GameState.PAUSED, GameState.GAME_OVER])
+    def test_update_does_nothing_when_not_running(self, game_stub, state):
+        """Test update does nothing when paused or after game over.
+
+        Args:
+            game_stub: The stub game fixture.
+            state: The non-running game state.
+
+        Verifies that update() neither moves the player nor changes the score.
+        """
+        game_stub.state = state
+        
+        Game.update(game_stub)
+        
+        assert game_stub.score == 0
+        game_stub.player.update_with_rects.assert_not_called()
+        game_stub.level.update.assert_not_called()
+    
+    def test_handle_player_input_paused(self, game_stub):
+        """Test player input does nothing when paused.
+
+        Args:
+            game_stub: The stub game fixture.
+
+        Verifies that handle_player_input() ignores input when game is paused.
+        """
+        game_stub.state = GameState.PAUSED
+        
+        Game.handle_player_input(game_stub)
+        
+        game_stub.player.move.assert_not_called()
+        game_stub.input_handler.get_movement_direction.assert_not_called()
+
+
 class TestGame:
     """Tests for Game class."""
     
-    @pytest.fixture
-    def game(self):
-        """Create a game instance for testing.
+    @pytest.fixture(autouse=True)
+    def reset_game(self, game):
+        """Return the shared game to a fresh state before each test.
 
-        Yields:
-            Game: A configured game instance with 800x600 resolution at 60 FPS.
-
-        Note:
-            Cleans up pygame resources after the test completes.
+        Args:
+            game: The shared game fixture instance.
         """
-        config = GameConfig(
-            window_width=800,
-            window_height=600,
-            fps=60
-        )
-        game = Game(config)
-        yield game
-        pygame.quit()
+        game.restart()
+        game.running = True
+        game.input_handler.reset()
     
     def test_initialization(self, game):
         """Test game initialization.
@@ -92,280 +225,218 @@ class TestGame:
         assert game.level is not None
         assert len(game.level.platforms) > 0
     
-    def test_renderer_initialized(self, game):
-        """Test renderer is initialized.
-
-        Args:
-            game: The game fixture instance.
-
-        Verifies the renderer component exists.
-        """
-        assert game.renderer is not None
-    
-    def test_input_handler_initialized(self, game):
-        """Test input handler is initialized.
-
-        Args:
-            game: The game fixture instance.
-
-        Verifies the input handler component exists.
-        """
-        assert game.input_handler is not None
-    
-    def test_restart_resets_state(self, game):
-        """Test restart resets game state.
+    @pytest.mark.parametrize("component", ["renderer", "input_handler"])
+    def test_component_initialized(self, game, component):
+        """Test the renderer and input handler are initialized.
 
         Args:
             game: The game fixture instance.
+            component: Name of the component attribute.
 
-        Verifies that calling restart() resets lives to 3, score to 0,
-        and state to RUNNING.
+        Verifies the component exists.
         """
-        game.lives = 1
-        game.score = 500
-        game.state = GameState.GAME_OVER
-        
-        game.restart()
-        
-        assert game.lives == 3
-        assert game.score == 0
-        assert game.state == GameState.RUNNING
+        assert getattr(game, component) is not None
     
-    def test_player_hit_decreases_lives(self, game):
-        """Test player hit decreases lives.
+    def test_update_increases_score(self, game):
+        """Test update increases score based on distance.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that _player_hit() decrements the lives counter by one.
+        Verifies that update() increases score proportional to player distance.
         """
-        initial_lives = game.lives
+        game.player.x = 500
         
-        game._player_hit()
+        game.update()
         
-        assert game.lives == initial_lives - 1
+        assert game.score >= 50  # 500 / 10
     
-    def test_player_hit_game_over(self, game):
-        """Test player hit causes game over at 0 lives.
+    def test_update_player_lands_on_nearby_platform(self, game):
+        """Test the player collides with platforms found by the broad phase.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that _player_hit() triggers GAME_OVER state when lives reach 0.
+        Verifies that the player falls from spawn and comes to rest on ground.
         """
-        game.lives = 1
+        for _ in range(120):
+            game.update()
         
-        game._player_hit()
-        
-        assert game.lives == 0
-        assert game.state == GameState.GAME_OVER
+        assert game.player.on_ground is True
+        assert game.player.dy == 0
     
-    def test_player_hit_resets_player(self, game):
-        """Test player hit resets player position.
+    def test_update_score_never_decreases(self, game):
+        """Test score keeps the furthest distance reached.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that _player_hit() resets the player to their spawn position.
+        Verifies that moving back towards the start does not lower the score.
         """
         game.player.x = 500
-        game.player.y = 100
-        
-        game._player_hit()
-        
-        assert game.player.x == game.player.spawn_x
-        assert game.player.y == game.player.spawn_y
-    
-    def test_update_paused_does_nothing(self, game):
-        """Test update does nothing when paused.
-
-        Args:
-            game: The game fixture instance.
-
-        Verifies that update() does not change the score when game is paused.
-        """
-        game.state = GameState.PAUSED
-        initial_score = game.score
+        game.update()
+        best_score = game.score
         
+        game.player.x = 200
         game.update()
         
-        assert game.score == initial_score
+        assert game.score == best_score
     
-    def test_update_game_over_does_nothing(self, game):
-        """Test update does nothing when game over.
+    def test_handle_events_quit(self, game):
+        """Test quit event stops game.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that update() does not change the score when game is over.
+        Verifies that a pygame QUIT event sets running to False.
         """
-        game.state = GameState.GAME_OVER
-        initial_score = game.score
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
         
-        game.update()
+        game.handle_events()
         
-        assert game.score == initial_score
+        assert game.running is False
     
-    def test_update_increases_score(self, game):
-        """Test update increases score based on distance.
+    def test_handle_events_keeps_posted_keydown_held(self, game):
+        """Test a posted KEYDOWN survives the keyboard state poll.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that update() increases score proportional to player distance.
+        Verifies that the action is still held after handle_events(),
+        though the keyboard never reported the key down.
         """
-        game.player.x = 500
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
         
-        game.update()
+        game.handle_events()
         
-        assert game.score >= 50  # 500 / 10
+        assert game.input_handler.is_action_held(Action.MOVE_RIGHT) is True
+        assert game.input_handler.get_movement_direction() == 1
     
-    def test_handle_player_input_paused(self, game):
-        """Test player input does nothing when paused.
+    def test_run_stops_after_max_frames(self, game):
+        """Test run stops after the requested number of frames.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that handle_player_input() ignores input when game is paused.
+        Verifies that run(max_frames) renders exactly that many frames.
         """
-        game.state = GameState.PAUSED
-        game.input_handler.held_actions.add(
-            __import__('src.input_handler', fromlist=['Action']).Action.MOVE_RIGHT
-        )
-        
-        game.handle_player_input()
-        
-        assert game.player.dx == 0
+        # run() shuts pygame down on exit; keep it up for the shared game
+        with patch.object(game, 'render') as mock_render, patch('pygame.quit'):
+            game.run(max_frames=3)
+            
+            assert mock_render.call_count == 3
     
-    def test_handle_events_quit(self, game):
-        """Test quit event stops game.
+    @pytest.fixture
+    def threat_level(self, game):
+        """Give the game a small level holding exactly one enemy and one hazard.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that a pygame QUIT event sets running to False.
+        Returns:
+            Level: The level now used by the game.
         """
-        with patch('pygame.event.get') as mock_get:
-            quit_event = MagicMock()
-            quit_event.type = pygame.QUIT
-            mock_get.return_value = [quit_event]
-            
-            game.handle_events()
-            
-            assert game.running is False
+        level = Level(game.config)
+        level.add_enemy(Enemy(400, 300, config=game.config))
+        level.add_hazard(Hazard(800, 300, 50, 20, config=game.config))
+        game.level = level
+        return level
     
-    def test_check_collisions_enemy(self, game):
+    def test_check_collisions_enemy(self, game, threat_level):
         """Test enemy collision triggers player hit.
 
         Args:
             game: The game fixture instance.
+            threat_level: Level with one enemy and one hazard.
 
         Verifies that colliding with an enemy decrements lives by one.
         """
         # Position player on enemy
-        if game.level.enemies:
-            enemy = game.level.enemies[0]
-            game.player.x = enemy.x
-            game.player.y = enemy.y
-            initial_lives = game.lives
-            
-            game._check_collisions()
-            
-            assert game.lives == initial_lives - 1
+        enemy = threat_level.enemies[0]
+        game.player.x = enemy.x
+        game.player.y = enemy.y
+        initial_lives = game.lives
+        
+        game._check_collisions()
+        
+        assert game.lives == initial_lives - 1
     
-    def test_check_collisions_hazard(self, game):
+    def test_check_collisions_hazard(self, game, threat_level):
         """Test hazard collision triggers player hit.
 
         Args:
             game: The game fixture instance.
+            threat_level: Level with one enemy and one hazard.
 
         Verifies that colliding with a hazard decrements lives by one.
         """
         # Position player on hazard
-        if game.level.hazards:
-            hazard = game.level.hazards[0]
-            game.player.x = hazard.x
-            game.player.y = hazard.y
-            initial_lives = game.lives
-            
-            game._check_collisions()
-            
-            assert game.lives == initial_lives - 1
-    
-    def test_check_collisions_out_of_bounds(self, game):
-        """Test out of bounds triggers player hit.
-
-        Args:
-            game: The game fixture instance.
-
-        Verifies that falling out of bounds decrements lives by one.
-        """
-        game.player.y = 1000  # Far below level
+        hazard = threat_level.hazards[0]
+        game.player.x = hazard.x
+        game.player.y = hazard.y
         initial_lives = game.lives
         
         game._check_collisions()
         
         assert game.lives == initial_lives - 1
     
-    def test_render_calls_renderer_methods(self, game):
-        """Test render calls appropriate renderer methods.
+    def test_check_collisions_clear_of_threats(self, game, threat_level):
+        """Test standing between threats does not hit the player.
 
         Args:
             game: The game fixture instance.
-
-        Verifies that render() calls clear, draw_level, draw_player, and draw_ui.
+            threat_level: Level with one enemy and one hazard.
         """
-        with patch.object(game.renderer, 'clear') as mock_clear, \
-             patch.object(game.renderer, 'draw_level') as mock_level, \
-             patch.object(game.renderer, 'draw_player') as mock_player, \
-             patch.object(game.renderer, 'draw_ui') as mock_ui, \
-             patch('pygame.display.flip'):
-            
-            game.render()
-            
-            mock_clear.assert_called_once()
-            mock_level.assert_called_once()
-            mock_player.assert_called_once()
-            mock_ui.assert_called_once()
+        game.player.x = 600
+        game.player.y = 300
+        
+        game._check_collisions()
+        
+        assert game.lives == 3
     
-    def test_render_draws_pause_overlay(self, game):
-        """Test render draws pause overlay when paused.
+    def test_check_collisions_out_of_bounds(self, game):
+        """Test out of bounds triggers player hit.
 
         Args:
             game: The game fixture instance.
 
-        Verifies that render() calls draw_pause when game state is PAUSED.
+        Verifies that falling out of bounds decrements lives by one.
         """
-        game.state = GameState.PAUSED
+        game.player.y = 1000  # Far below level
+        initial_lives = game.lives
         
-        with patch.object(game.renderer, 'clear'), \
-             patch.object(game.renderer, 'draw_level'), \
-             patch.object(game.renderer, 'draw_player'), \
-             patch.object(game.renderer, 'draw_ui'), \
-             patch.object(game.renderer, 'draw_pause') as mock_pause, \
-             patch('pygame.display.flip'):
-            
-            game.render()
-            
-            mock_pause.assert_called_once()
+        game._check_collisions()
+        
+        assert game.lives == initial_lives - 1
     
-    def test_render_draws_game_over_overlay(self, game):
-        """Test render draws game over overlay.
+    @pytest.mark.parametrize("state, overlay", [
+        (GameState.RUNNING, None),
+        (GameState.PAUSED, 'draw_pause'),
+        (GameState.GAME_OVER, 'draw_game_over'),
+    ])
+    def test_render_calls_renderer_methods(self, game, state, overlay):
+        """Test render calls the renderer methods for the current state.
 
         Args:
             game: The game fixture instance.
+            state: Game state to render.
+            overlay: Overlay method expected for the state, if any.
 
-        Verifies that render() calls draw_game_over when state is GAME_OVER.
+        Verifies that render() always calls clear, draw_level, draw_player
+        and draw_ui, and draws exactly the overlay that matches the state.
         """
-        game.state = GameState.GAME_OVER
+        game.state = state
         
-        with patch.object(game.renderer, 'clear'), \
-             patch.object(game.renderer, 'draw_level'), \
-             patch.object(game.renderer, 'draw_player'), \
-             patch.object(game.renderer, 'draw_ui'), \
-             patch.object(game.renderer, 'draw_game_over') as mock_game_over, \
-             patch('pygame.display.flip'):
+        with patch.multiple(
+            game.renderer, clear=DEFAULT, draw_level=DEFAULT, draw_player=DEFAULT,
+            draw_ui=DEFAULT, draw_pause=DEFAULT, draw_game_over=DEFAULT
+        ) as mocks, patch('pygame.display.flip'):
             
             game.render()
-            
-            mock_game_over.assert_called_once()
+        
+        for name in ('clear', 'draw_level', 'draw_player', 'draw_ui'):
+            mocks[name].assert_called_once()
+        for name in ('draw_pause', 'draw_game_over'):
+            assert mocks[name].call_count == (name == overlay)
@@ -3,14 +3,17 @@ Tests for the input_handler module.
 """
 
 import pytest
+from collections import defaultdict, namedtuple
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, patch
 import pygame
 
 from src.input_handler import InputHandler, Action, KeyBinding
 
 
-# Initialize pygame for event constants
-pygame.init()
+# Lightweight stand-in for a pygame key event; the handler only reads
+# ``type`` and ``key``
+FakeEvent = namedtuple('FakeEvent', ['type', 'key'])
 
 
 class TestKeyBinding:
@@ -37,6 +40,31 @@ class TestKeyBinding:
         
         assert binding.primary == pygame.K_LEFT
         assert binding.secondary == pygame.K_a
+    
+    def test_is_immutable(self):
+        """Test key bindings cannot be changed after creation.
+
+        Verifies that bindings are frozen and compare and hash by value.
+        """
+        binding = KeyBinding(pygame.K_LEFT, pygame.K_a)
+        
+        with pytest.raises(FrozenInstanceError):
+            binding.primary = pygame.K_RIGHT
+        assert binding == KeyBinding(pygame.K_LEFT, pygame.K_a)
+        assert hash(binding) == hash(KeyBinding(pygame.K_LEFT, pygame.K_a))
+
+
+class TestAction:
+    """Tests for Action enum."""
+    
+    def test_members_are_ints(self):
+        """Test actions are plain ints usable as bit positions.
+
+        Verifies that each action equals its value.
+        """
+        for action in Action:
+            assert isinstance(action, int)
+            assert action == action.value
 
 
 class TestInputHandler:
@@ -61,11 +89,24 @@ class TestInputHandler:
 
         Verifies that all expected default action bindings are present.
         """
-        assert Action.MOVE_LEFT in input_handler.bindings
-        assert Action.MOVE_RIGHT in input_handler.bindings
-        assert Action.JUMP in input_handler.bindings
-        assert Action.FLIP_GRAVITY in input_handler.bindings
-        assert Action.PAUSE in input_handler.bindings
+        assert Action.MOVE_LEFT in input_handler.supported_actions
+        assert Action.MOVE_RIGHT in input_handler.supported_actions
+        assert Action.JUMP in input_handler.supported_actions
+        assert Action.FLIP_GRAVITY in input_handler.supported_actions
+        assert Action.PAUSE in input_handler.supported_actions
+    
+    def test_supported_actions_follow_rebind(self):
+        """Test rebinding a new action adds it to the supported actions.
+
+        Verifies that custom bindings only support their own actions until
+        another action is bound.
+        """
+        handler = InputHandler({Action.JUMP: KeyBinding(pygame.K_UP, None)})
+        assert handler.supported_actions == {Action.JUMP}
+        
+        handler.rebind(Action.PAUSE, KeyBinding(pygame.K_p, None))
+        
+        assert handler.supported_actions == {Action.JUMP, Action.PAUSE}
     
     def test_custom_bindings(self):
         """Test custom key bindings.
@@ -116,6 +157,60 @@ class TestInputHandler:
         
         assert action is None
     
+    def test_rebind_updates_key_lookup(self, input_handler):
+        """Test rebinding an action updates key lookup.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+
+        Verifies that the new keys map to the action and the old ones do not.
+        """
+        input_handler.rebind(Action.JUMP, KeyBinding(pygame.K_j, pygame.K_k))
+        
+        assert input_handler._get_action_for_key(pygame.K_j) == Action.JUMP
+        assert input_handler._get_action_for_key(pygame.K_k) == Action.JUMP
+        assert input_handler._get_action_for_key(pygame.K_SPACE) is None
+    
+    def test_custom_bindings_are_copied(self):
+        """Test the handler is not affected by later changes to the given dict.
+
+        Verifies that the caller's dict is neither kept nor mutated by rebind.
+        """
+        custom = {Action.JUMP: KeyBinding(pygame.K_UP, None)}
+        handler = InputHandler(custom)
+        
+        custom[Action.JUMP] = KeyBinding(pygame.K_j, None)
+        handler.rebind(Action.PAUSE, KeyBinding(pygame.K_p, None))
+        
+        assert handler._get_action_for_key(pygame.K_UP) == Action.JUMP
+        assert handler._get_action_for_key(pygame.K_j) is None
+        assert Action.PAUSE not in custom
+    
+    def test_bindings_are_read_only(self, input_handler):
+        """Test bindings cannot be changed without going through rebind.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        with pytest.raises(TypeError):
+            input_handler.bindings[Action.JUMP] = KeyBinding(pygame.K_j, None)
+    
+    def test_rebind_does_not_change_shared_defaults(self):
+        """Test rebinding one handler leaves other default handlers alone.
+
+        Verifies that handlers on the default bindings share them until
+        one of them is rebound.
+        """
+        first = InputHandler()
+        second = InputHandler()
+        assert first.bindings is second.bindings
+        
+        first.rebind(Action.JUMP, KeyBinding(pygame.K_j, None))
+        
+        assert second._get_action_for_key(pygame.K_SPACE) == Action.JUMP
+        assert second._get_action_for_key(pygame.K_j) is None
+        assert InputHandler.DEFAULT_BINDINGS[Action.JUMP].primary == pygame.K_SPACE
+    
     def test_process_keydown_event(self, input_handler):
         """Test processing keydown event.
 
@@ -125,9 +220,7 @@ class TestInputHandler:
         Verifies that a keydown event adds the action to held_actions
         and marks it as pressed this frame.
         """
-        event = MagicMock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_SPACE
+        event = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
         
         input_handler.process_events([event])
         
@@ -144,20 +237,53 @@ class TestInputHandler:
         and marks it as released this frame.
         """
         # First press the key
-        down_event = MagicMock()
-        down_event.type = pygame.KEYDOWN
-        down_event.key = pygame.K_SPACE
+        down_event = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
         input_handler.process_events([down_event])
         
         # Then release it
-        up_event = MagicMock()
-        up_event.type = pygame.KEYUP
-        up_event.key = pygame.K_SPACE
+        up_event = FakeEvent(pygame.KEYUP, pygame.K_SPACE)
         input_handler.process_events([up_event])
         
         assert Action.JUMP not in input_handler.held_actions
         assert input_handler.is_action_released(Action.JUMP)
     
+    def test_begin_frame_and_handle_event(self, input_handler):
+        """Test feeding events one at a time.
+        
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        
+        Verifies that handle_event updates state like process_events and
+        that begin_frame clears only the per-frame state.
+        """
+        event = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
+        
+        input_handler.begin_frame()
+        input_handler.handle_event(event)
+        assert input_handler.is_action_pressed(Action.JUMP) is True
+        
+        input_handler.begin_frame()
+        assert input_handler.is_action_pressed(Action.JUMP) is False
+        assert input_handler.is_action_held(Action.JUMP) is True
+    
+    def test_sync_held_from_key_state(self, input_handler):
+        """Test a keyboard state snapshot adds held actions.
+        
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        
+        Verifies that a secondary key counts as held and that an action
+        held from events stays held though its key is not down.
+        """
+        input_handler.held_actions.add(Action.JUMP)
+        keys = defaultdict(bool, {pygame.K_a: True})
+        
+        input_handler.sync_held(keys)
+        
+        assert input_handler.is_action_held(Action.MOVE_LEFT) is True
+        assert input_handler.is_action_held(Action.JUMP) is True
+        assert input_handler.get_movement_direction() == -1
+    
     def test_is_action_held(self, input_handler):
         """Test is_action_held method.
 
@@ -181,9 +307,7 @@ class TestInputHandler:
         Verifies that pressed state is only valid for one frame
         and clears when process_events is called again.
         """
-        event = MagicMock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_SPACE
+        event = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
         
         input_handler.process_events([event])
         assert input_handler.is_action_pressed(Action.JUMP) is True
@@ -192,6 +316,44 @@ class TestInputHandler:
         input_handler.process_events([])
         assert input_handler.is_action_pressed(Action.JUMP) is False
     
+    def test_process_events_batches_within_frame(self, input_handler):
+        """Test several event batches can feed the same frame.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        jump = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+        pause = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        
+        input_handler.process_events([jump])
+        input_handler.process_events([pause], new_frame=False)
+        
+        assert input_handler.should_jump() is True
+        assert input_handler.should_pause() is True
+        
+        input_handler.process_events([])
+        
+        assert input_handler.should_jump() is False
+        assert input_handler.should_pause() is False
+    
+    def test_process_events_reads_key_events_from_queue(self, input_handler):
+        """Test process_events without a list drains only key events.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+
+        Verifies that queued key events are applied and that other events
+        are left on the queue for the game loop.
+        """
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        
+        input_handler.process_events()
+        
+        assert input_handler.is_action_pressed(Action.JUMP) is True
+        assert [event.type for event in pygame.event.get()] == [pygame.QUIT]
+    
     def test_get_movement_direction_right(self, input_handler):
         """Test movement direction when holding right.
 
@@ -344,14 +506,74 @@ class TestInputHandler:
         callback = MagicMock()
         input_handler.register_callback(Action.JUMP, callback)
         
-        event = MagicMock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_SPACE
+        event = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
         
         input_handler.process_events([event])
         
         callback.assert_called_once()
     
+    def test_register_callback_replaces_previous(self, input_handler):
+        """Test registering a second callback for an action replaces the first.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        first = MagicMock()
+        second = MagicMock()
+        input_handler.register_callback(Action.JUMP, first)
+        input_handler.register_callback(Action.JUMP, second)
+        
+        input_handler.process_events([FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)])
+        
+        first.assert_not_called()
+        second.assert_called_once()
+    
+    def test_callback_only_for_its_action(self, input_handler):
+        """Test a callback is not triggered by other actions.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        callback = MagicMock()
+        input_handler.register_callback(Action.JUMP, callback)
+        
+        event = FakeEvent(pygame.KEYDOWN, pygame.K_LEFT)
+        
+        input_handler.process_events([event])
+        
+        callback.assert_not_called()
+        assert input_handler.is_action_pressed(Action.MOVE_LEFT) is True
+    
+    def test_callback_once_per_frame(self, input_handler):
+        """Test repeated presses in one frame trigger the callback once.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        callback = MagicMock()
+        input_handler.register_callback(Action.JUMP, callback)
+        down = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
+        
+        input_handler.process_events([down, down, FakeEvent(pygame.KEYDOWN, pygame.K_w)])
+        assert callback.call_count == 1
+        
+        input_handler.process_events([down])
+        assert callback.call_count == 2
+    
+    def test_press_release_press_in_one_frame_stays_held(self, input_handler):
+        """Test a key pressed again after release within a frame is held.
+
+        Args:
+            input_handler: Pytest fixture providing an InputHandler instance.
+        """
+        down = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
+        up = FakeEvent(pygame.KEYUP, pygame.K_SPACE)
+        
+        input_handler.process_events([down, up, down])
+        
+        assert input_handler.is_action_held(Action.JUMP) is True
+        assert input_handler.is_action_released(Action.JUMP) is True
+    
     def test_callback_not_called_on_release(self, input_handler):
         """Test callback is not called on key release.
 
@@ -365,16 +587,12 @@ class TestInputHandler:
         input_handler.register_callback(Action.JUMP, callback)
         
         # Press and release
-        down = MagicMock()
-        down.type = pygame.KEYDOWN
-        down.key = pygame.K_SPACE
+        down = FakeEvent(pygame.KEYDOWN, pygame.K_SPACE)
         input_handler.process_events([down])
         
         callback.reset_mock()
         
-        up = MagicMock()
-        up.type = pygame.KEYUP
-        up.key = pygame.K_SPACE
+        up = FakeEvent(pygame.KEYUP, pygame.K_SPACE)
         input_handler.process_events([up])
         
         callback.assert_not_called()
@@ -56,6 +56,19 @@ class TestLevel:
         assert len(level.platforms) == 1
         assert platform in level.platforms
     
+    def test_add_platform_tracks_gravity_platforms(self, level, platform, gravity_platform):
+        """Test gravity platforms are also listed separately.
+
+        Args:
+            level: Level fixture providing a level instance.
+            platform: Platform fixture providing a platform instance.
+            gravity_platform: GravityPlatform fixture providing a gravity platform.
+        """
+        level.add_platform(platform)
+        level.add_platform(gravity_platform)
+        
+        assert level.gravity_platforms == [gravity_platform]
+    
     def test_add_enemy(self, level, enemy):
         """Test adding an enemy.
 
@@ -131,6 +144,23 @@ class TestLevel:
         
         assert moving_platform.x != initial_x
     
+    def test_update_updates_gravity_platforms(self, level, platform, gravity_platform):
+        """Test update advances gravity platforms alongside static ones.
+
+        Args:
+            level: Level fixture providing a level instance.
+            platform: Platform fixture providing a static platform.
+            gravity_platform: GravityPlatform fixture providing a gravity platform.
+        """
+        level.add_platform(platform)
+        level.add_platform(gravity_platform)
+        gravity_platform.set_gravity(-1)
+        initial_y = gravity_platform.y
+        
+        level.update(0)
+        
+        assert gravity_platform.y < initial_y
+    
     def test_update_updates_enemies(self, level, enemy):
         """Test update updates enemies.
 
@@ -146,6 +176,300 @@ class TestLevel:
         # Enemy should have moved or had gravity applied
         assert enemy.x != initial_x or enemy.dy != 0
     
+    def test_update_enemy_lands_on_platform(self, level, config):
+        """Test a simulated enemy collides with the platforms near the view.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        for x in range(0, 1000, 100):
+            level.add_platform(Platform(x, 100, 50, 20, config=config))
+        ground = Platform(1000, 550, 500, 50, config=config)
+        level.add_platform(ground)
+        enemy = Enemy(1200, 500, config=config)
+        level.add_enemy(enemy)
+        
+        for _ in range(30):
+            level.update(1200)
+        
+        assert enemy.rect.bottom <= ground.rect.top
+    
+    def test_update_freezes_distant_enemies(self, level, config):
+        """Test enemies far outside the view are not simulated.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        level.level_bounds = (0, 10000, 0, config.window_height)
+        far_enemy = Enemy(9000, 100, config=config)
+        level.add_enemy(far_enemy)
+        
+        level.update(0)
+        
+        assert far_enemy.x == 9000
+        assert far_enemy.dy == 0
+    
+    def test_update_simulates_enemies_added_later(self, level, config):
+        """Test enemies added after an update are picked up by the next one.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        level.update(0)
+        late_enemy = Enemy(200, 100, config=config)
+        level.add_enemy(late_enemy)
+        
+        level.update(0)
+        
+        assert late_enemy.x != 200
+        assert level.get_threat_rects() == [late_enemy.rect]
+    
+    def test_get_collision_rects_in_range(self, level, config):
+        """Test range queries return only nearby platforms.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        near = Platform(100, 500, 200, 50, config=config)
+        wide = Platform(-1000, 550, 1200, 50, config=config)
+        far = Platform(5000, 500, 200, 50, config=config)
+        for platform in (far, near, wide):
+            level.add_platform(platform)
+        
+        result = level.get_collision_rects(150, 400)
+        
+        assert result == [wide.rect, near.rect]
+        assert far.rect not in result
+    
+    def test_get_collision_rects_ignore_span_of_wide_platform(self, level, config):
+        """Test a very wide platform does not widen other range queries.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        ground = Platform(0, 550, 3000, 50, config=config)
+        start = Platform(100, 400, 150, 25, config=config)
+        level.add_platform(ground)
+        level.add_platform(start)
+        
+        assert level.get_collision_rects(2800, 2850) == [ground.rect]
+    
+    def test_get_collision_rects_cover_moving_platform_path(self, level, config):
+        """Test range queries cover a moving platform's whole path.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        moving = MovingPlatform(0, 300, 100, 25, end_x=1000, end_y=300, config=config)
+        level.add_platform(moving)
+        
+        assert level.get_collision_rects(900, 950) == [moving.rect]
+    
+    def test_get_collision_rects_follow_moving_platform(self, level, config):
+        """Test cached collision rects track moving platforms.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        moving = MovingPlatform(0, 300, 100, 25, end_x=200, end_y=300, config=config)
+        level.add_platform(moving)
+        
+        level.update(0)
+        
+        assert level.get_collision_rects(0, 300) == [
+            (int(moving.x), int(moving.y), 100, 25)
+        ]
+    
+    def test_get_collision_rects_spanning_columns_after_add(self, level, config):
+        """Test remembered multi-column spans are dropped when platforms change.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        first = Platform(100, 500, 100, 50, config=config)
+        level.add_platform(first)
+        assert level.get_collision_rects(0, 1000) == [first.rect]
+        
+        second = Platform(600, 500, 100, 50, config=config)
+        level.add_platform(second)
+        
+        assert level.get_collision_rects(0, 1000) == [first.rect, second.rect]
+    
+    def test_platform_index_follows_replaced_list(self, level, config):
+        """Test assigning a new platform list of the same length is picked up.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        old = Platform(0, 500, 200, 50, config=config)
+        level.add_platform(old)
+        assert level.get_collision_rects(0, 300) == [old.rect]
+        
+        new = Platform(1000, 100, 200, 50, config=config)
+        level.platforms = [new]
+        
+        assert level.get_collision_rects(0, 300) == []
+        assert level.visible_platforms(900, 1300) == [(new, new.rect)]
+    
+    def test_platform_index_follows_list_changes(self, level, config):
+        """Test platforms replaced or removed through the list are picked up.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        first = Platform(0, 500, 200, 50, config=config)
+        second = Platform(300, 500, 200, 50, config=config)
+        level.add_platform(first)
+        level.add_platform(second)
+        assert level.get_collision_rects(0, 600) == [first.rect, second.rect]
+        
+        moved = Platform(2000, 500, 200, 50, config=config)
+        level.platforms[0] = moved
+        assert level.get_collision_rects(0, 600) == [second.rect]
+        
+        del level.platforms[1]
+        assert level.get_collision_rects(0, 600) == []
+        assert level.get_collision_rects(1900, 2300) == [moved.rect]
+    
+    def test_visible_platforms(self, level, config):
+        """Test visible platforms are exact and paired with their rects.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        visible = Platform(100, 500, 200, 50, config=config)
+        same_cell = Platform(420, 500, 50, 50, config=config)
+        level.add_platform(same_cell)
+        level.add_platform(visible)
+        
+        assert level.visible_platforms(0, 400) == [(visible, visible.rect)]
+    
+    def test_get_threat_rects(self, level, enemy, hazard):
+        """Test threat rectangles list enemies before hazards.
+
+        Args:
+            level: Level fixture providing a level instance.
+            enemy: Enemy fixture providing an enemy instance.
+            hazard: Hazard fixture providing a hazard instance.
+        """
+        level.add_hazard(hazard)
+        level.add_enemy(enemy)
+        
+        assert level.get_threat_rects() == [enemy.rect, hazard.rect]
+    
+    def test_get_threat_rects_skips_frozen_enemies(self, level, config):
+        """Test threat rectangles only cover enemies near the view.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        level.level_bounds = (0, 10000, 0, 600)
+        near = Enemy(300, 100, config=config)
+        far = Enemy(8000, 100, config=config)
+        level.add_enemy(near)
+        level.add_enemy(far)
+        
+        level.update(0)
+        
+        assert level.get_threat_rects() == [near.rect]
+    
+    @pytest.fixture
+    def near_threats(self, level, config):
+        """Add an enemy and a hazard near the start, and one of each far away.
+
+        The far ones are added first, so range queries must not rely on
+        insertion order.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+
+        Returns:
+            Tuple[Enemy, Hazard]: The enemy and hazard near the start.
+        """
+        near_enemy = Enemy(300, 100, patrol_distance=50, config=config)
+        far_enemy = Enemy(3000, 100, patrol_distance=50, config=config)
+        near_hazard = Hazard(400, 550, 50, 20, config=config)
+        far_hazard = Hazard(2000, 550, 50, 20, config=config)
+        for enemy in (far_enemy, near_enemy):
+            level.add_enemy(enemy)
+        for hazard in (far_hazard, near_hazard):
+            level.add_hazard(hazard)
+        return near_enemy, near_hazard
+    
+    def test_get_threat_rects_in_range(self, level, near_threats):
+        """Test a range query only returns nearby enemies and hazards.
+
+        Args:
+            level: Level fixture providing a level instance.
+            near_threats: The enemy and hazard near the start.
+        """
+        near_enemy, near_hazard = near_threats
+        
+        result = level.get_threat_rects(340, 420)
+        
+        assert result == [near_enemy.rect, near_hazard.rect]
+    
+    def test_enemies_and_hazards_in_range(self, level, near_threats):
+        """Test range queries return only nearby enemies and hazards.
+
+        Args:
+            level: Level fixture providing a level instance.
+            near_threats: The enemy and hazard near the start.
+        """
+        near_enemy, near_hazard = near_threats
+        
+        assert level.enemies_in_range(0, 800) == [near_enemy]
+        assert level.hazards_in_range(0, 800) == [near_hazard]
+    
+    def test_threat_index_follows_replaced_hazard(self, level, config):
+        """Test a hazard replaced in place moves the threat it reports.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        old = Hazard(300, 550, 50, 20, config=config)
+        level.add_hazard(old)
+        assert level.get_threat_rects(0, 400) == [old.rect]
+        
+        new = Hazard(3000, 550, 50, 20, config=config)
+        level.hazards[0] = new
+        
+        assert level.get_threat_rects(0, 400) == []
+        assert level.get_threat_rects(2900, 3100) == [new.rect]
+        assert level.get_threat_rects() == [new.rect]
+    
+    def test_threat_index_follows_replaced_enemies(self, level, config):
+        """Test assigning a new enemy list drops the enemies it replaced.
+
+        Args:
+            level: Level fixture providing a level instance.
+            config: GameConfig fixture providing game configuration.
+        """
+        old = Enemy(300, 100, config=config)
+        level.add_enemy(old)
+        level.update(0)
+        assert level.get_threat_rects() == [old.rect]
+        
+        new = Enemy(500, 100, config=config)
+        level.enemies = [new]
+        
+        assert level.get_threat_rects() == [new.rect]
+        assert level.enemies_in_range(0, 200) == []
+    
     def test_set_gravity_for_all_enemies(self, level, enemy):
         """Test setting gravity for all enemies.
 
@@ -173,6 +497,20 @@ class TestLevel:
         assert gravity_platform.gravity_direction == -1
         assert gravity_platform.is_falling is True
     
+    def test_set_gravity_for_appended_gravity_platform(self, level, gravity_platform):
+        """Test gravity reaches gravity platforms appended to the list directly.
+
+        Args:
+            level: Level fixture providing a level instance.
+            gravity_platform: GravityPlatform fixture providing a gravity platform.
+        """
+        level.platforms.append(gravity_platform)
+        
+        level.set_gravity_for_all(-1)
+        
+        assert gravity_platform.gravity_direction == -1
+        assert level.gravity_platforms == [gravity_platform]
+    
     def test_reset_camera(self, level):
         """Test reset resets camera.
 
@@ -315,6 +653,28 @@ class TestLevelLoader:
         finally:
             os.unlink(filepath)
     
+    def test_save_and_load_json_stdlib_fallback(self, level, platform, monkeypatch):
+        """Test saving and loading without orjson installed.
+
+        Args:
+            level: Level fixture providing a level instance.
+            platform: Platform fixture providing a platform instance.
+            monkeypatch: Pytest fixture used to hide orjson.
+        """
+        monkeypatch.setattr('src.level.orjson', None)
+        level.add_platform(platform)
+        
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            filepath = f.name
+        
+        try:
+            LevelLoader.save_to_json(level, filepath)
+            loaded_level = LevelLoader.load_from_json(filepath)
+            
+            assert loaded_level.platforms[0].rect == platform.rect
+        finally:
+            os.unlink(filepath)
+    
     def test_load_moving_platform_from_json(self, config):
         """Test loading moving platform from JSON.
 
@@ -384,6 +744,30 @@ class TestLevelLoader:
         finally:
             os.unlink(filepath)
     
+    def test_load_unknown_platform_type_as_static(self, config):
+        """Test platforms with an unknown or missing type load as static.
+
+        Args:
+            config: GameConfig fixture providing game configuration.
+        """
+        level_data = {
+            'platforms': [
+                {'type': 'bouncy', 'x': 0, 'y': 500, 'width': 100, 'height': 25},
+                {'x': 200, 'y': 500, 'width': 100, 'height': 25}
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(level_data, f)
+            filepath = f.name
+        
+        try:
+            loaded_level = LevelLoader.load_from_json(filepath, config)
+            
+            assert [type(p) for p in loaded_level.platforms] == [Platform, Platform]
+        finally:
+            os.unlink(filepath)
+    
     def test_save_moving_platform_type(self, level, config):
         """Test saving moving platform preserves type.
 
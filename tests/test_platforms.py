@@ -3,7 +3,8 @@ Tests for the platforms module.
 """
 
 import pytest
-from src.platforms import Platform, MovingPlatform, GravityPlatform
+import pygame
+from src.platforms import Platform, MovingPlatform, GravityPlatform, update_moving_platforms
 from src.config import GameConfig
 
 
@@ -57,6 +58,26 @@ class TestPlatform:
         assert rect.width == 200
         assert rect.height == 50
     
+    def test_rect_is_reused(self, platform):
+        """Test the cached rect is reused and follows the platform.
+
+        Args:
+            platform: Platform fixture.
+        """
+        rect = platform.rect
+        platform.y = 420.6
+        
+        assert platform.rect is rect
+        assert rect.y == 420
+    
+    def test_slotted(self, platform):
+        """Test platforms use __slots__ instead of an instance dict.
+
+        Args:
+            platform: Platform fixture.
+        """
+        assert not hasattr(platform, '__dict__')
+    
     def test_update_does_nothing(self, platform):
         """Test update on static platform does nothing.
 
@@ -93,6 +114,38 @@ class TestPlatform:
         
         assert render_rect.x == platform.x - camera_x
         assert render_rect.y == platform.y
+    
+    def test_fill_render_rect(self, platform):
+        """Test filling an existing rect matches get_render_rect.
+
+        Args:
+            platform: Platform fixture.
+        """
+        rect = pygame.Rect(0, 0, 0, 0)
+        
+        result = platform.fill_render_rect(rect, 50)
+        
+        assert result is rect
+        assert rect == platform.get_render_rect(50)
+    
+    def test_draw_decoration_per_type(self, config):
+        """Test each platform type draws its own border.
+
+        Args:
+            config: Game configuration fixture.
+        """
+        platforms = [
+            (Platform(0, 0, 20, 10, config=config), (0, 0, 0)),
+            (MovingPlatform(0, 0, 20, 10, end_x=50, end_y=0, config=config), (150, 150, 170)),
+            (GravityPlatform(0, 0, 20, 10, config=config), (100, 150, 200)),
+        ]
+        
+        for platform, border in platforms:
+            surface = pygame.Surface((20, 10))
+            platform.draw_decoration(surface, surface.get_rect())
+            
+            assert surface.get_at((0, 0))[:3] == border
+            assert surface.get_at((10, 5))[:3] == (0, 0, 0)
 
 
 class TestMovingPlatform:
@@ -165,6 +218,19 @@ class TestMovingPlatform:
         assert dx != 0
         assert dy == 0  # Not moving vertically in this case
     
+    def test_get_velocity_matches_update_step(self, moving_platform):
+        """Test get_velocity equals the distance moved by one update.
+
+        Args:
+            moving_platform: MovingPlatform fixture.
+        """
+        dx, dy = moving_platform.get_velocity()
+        initial_x = moving_platform.x
+        
+        moving_platform.update()
+        
+        assert moving_platform.x - initial_x == pytest.approx(dx)
+    
     def test_vertical_movement(self, config):
         """Test vertically moving platform.
 
@@ -180,6 +246,34 @@ class TestMovingPlatform:
         assert platform.x == 100
 
 
+class TestUpdateMovingPlatforms:
+    """Tests for the batched update_moving_platforms function."""
+    
+    def test_matches_per_platform_update(self, config):
+        """Test batched update produces the same state as MovingPlatform.update.
+
+        Args:
+            config: Game configuration fixture.
+        """
+        batched = [
+            MovingPlatform(0, 300, 100, 25, end_x=200, end_y=300, speed=3.0, config=config),
+            MovingPlatform(50, 100, 80, 20, end_x=50, end_y=400, speed=7.0, config=config),
+        ]
+        single = [
+            MovingPlatform(0, 300, 100, 25, end_x=200, end_y=300, speed=3.0, config=config),
+            MovingPlatform(50, 100, 80, 20, end_x=50, end_y=400, speed=7.0, config=config),
+        ]
+        
+        for _ in range(100):
+            update_moving_platforms(batched)
+            for platform in single:
+                platform.update()
+        
+        for a, b in zip(batched, single):
+            assert (a.x, a.y, a.progress, a.direction) == \
+                (b.x, b.y, b.progress, b.direction)
+
+
 class TestGravityPlatform:
     """Tests for GravityPlatform class."""
     
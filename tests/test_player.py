@@ -51,6 +51,19 @@ class TestPlayer:
         assert rect.width == player.width
         assert rect.height == player.height
     
+    def test_rect_tracks_position(self, player):
+        """Test the cached rect is reused and follows the player.
+
+        Args:
+            player: Player fixture to get rect from.
+        """
+        rect = player.rect
+        player.x = 150.9
+        player.y = 250.1
+        
+        assert player.rect is rect
+        assert (rect.x, rect.y) == (150, 250)
+    
     def test_move_right(self, player):
         """Test moving right sets correct velocity.
 
@@ -322,6 +335,44 @@ class TestPlayer:
         assert player.y == platform.rect.bottom
         assert player.dy == 0
     
+    def test_vertical_collision_lands_on_highest_overlap(self, player, config):
+        """Test falling into two platforms snaps onto the higher one.
+
+        Args:
+            player: Player fixture to test collision on.
+            config: Game configuration fixture for platform creation.
+        """
+        lower = Platform(80, 370, 100, 50, config=config)
+        upper = Platform(80, 360, 100, 50, config=config)
+        player.x = 100
+        player.y = 300
+        player.dy = 20
+        
+        player.update([lower, upper])
+        
+        assert player.y == upper.rect.top - player.height
+        assert player.on_ground is True
+    
+    def test_vertical_collision_inverted_landing(self, player, config):
+        """Test landing on a ceiling with inverted gravity.
+
+        Args:
+            player: Player fixture to test collision on.
+            config: Game configuration fixture for platform creation.
+        """
+        far = Platform(600, 0, 50, 50, config=config)
+        ceiling = Platform(80, 200, 100, 50, config=config)
+        player.flip_gravity()
+        player.x = 100
+        player.y = 260
+        player.dy = -20
+        
+        player.update([far, ceiling])
+        
+        assert player.y == ceiling.rect.bottom
+        assert player.dy == 0
+        assert player.on_ground is True
+    
     def test_check_enemy_collision_hit(self, player, enemy):
         """Test enemy collision detection when hit.
 
@@ -5,11 +5,6 @@ Tests for the renderer module.
 import pytest
 from unittest.mock import MagicMock, patch
 import pygame
-import os
-
-# Set dummy drivers
-os.environ['SDL_VIDEODRIVER'] = 'dummy'
-os.environ['SDL_AUDIODRIVER'] = 'dummy'
 
 from src.renderer import Renderer
 from src.config import GameConfig
@@ -26,16 +21,15 @@ class TestRenderer:
     def renderer(self):
         """Create a renderer instance for testing.
 
-        Yields:
-            Renderer: A configured renderer instance with an initialized pygame display.
+        pygame is initialized once per session; only the window is
+        opened again for each test.
+
+        Returns:
+            Renderer: A configured renderer instance drawing to the display.
         """
-        pygame.init()
-        pygame.font.init()
         config = GameConfig()
         screen = pygame.display.set_mode((config.window_width, config.window_height))
-        renderer = Renderer(screen, config)
-        yield renderer
-        pygame.quit()
+        return Renderer(screen, config)
     
     @pytest.fixture
     def player(self):
@@ -131,6 +125,20 @@ class TestRenderer:
         renderer.draw_background(0)
         renderer.draw_background(100)
     
+    def test_draw_background_layers(self, renderer):
+        """Test the pre-rendered background shows every layer band.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that each parallax layer color appears in its band.
+        """
+        renderer.draw_background(250)
+        
+        layer_height = renderer.config.window_height // len(renderer.bg_layers)
+        for i, (color, _) in enumerate(renderer.bg_layers):
+            assert renderer.screen.get_at((10, i * layer_height))[:3] == color
+    
     def test_draw_player(self, renderer, player):
         """Test draw_player runs without error.
 
@@ -189,6 +197,24 @@ class TestRenderer:
         renderer.config.show_hitboxes = True
         renderer.draw_player(player, 0)
     
+    def test_player_sprite_per_variant(self, renderer, player):
+        """Test the player sprite is rendered once per facing and gravity.
+
+        Args:
+            renderer: The renderer fixture.
+            player: The player fixture.
+
+        Verifies that drawing every variant twice builds only four sprites.
+        """
+        for _ in range(2):
+            for facing_right in (True, False):
+                for gravity_direction in (1, -1):
+                    player.facing_right = facing_right
+                    player.gravity_direction = gravity_direction
+                    renderer.draw_player(player, 0)
+        
+        assert len(renderer._player_sprites) == 4
+    
     def test_draw_platform(self, renderer, platform):
         """Test draw_platform runs without error.
 
@@ -370,6 +396,55 @@ class TestRenderer:
         renderer.config.show_hitboxes = True
         renderer.draw_hazard(hazard, 0)
     
+    def test_platform_sprite_per_type(self, renderer, moving_platform):
+        """Test platform sprites are shared by type, size and color.
+
+        Args:
+            renderer: The renderer fixture.
+            moving_platform: The moving platform fixture.
+
+        Verifies that a static platform of the same size gets its own sprite.
+        """
+        config = moving_platform.config
+        twin = MovingPlatform(500, 100, 100, 25, end_x=600, end_y=100, config=config)
+        static = Platform(500, 100, 100, 25, config=config)
+        
+        sprite = renderer._get_platform_sprite(moving_platform)
+        
+        assert renderer._get_platform_sprite(twin) is sprite
+        assert renderer._get_platform_sprite(static) is not sprite
+    
+    def test_hazard_sprite_is_shared(self, renderer, hazard):
+        """Test hazards of the same size and color share one sprite.
+
+        Args:
+            renderer: The renderer fixture.
+            hazard: The hazard fixture.
+
+        Verifies that hazard sprites are rendered once per distinct look.
+        """
+        twin = Hazard(900, 100, hazard.width, hazard.height, config=hazard.config)
+        
+        sprite = renderer._get_hazard_sprite(hazard)
+        
+        assert renderer._get_hazard_sprite(twin) is sprite
+        assert sprite.get_size() == (hazard.width, hazard.height)
+    
+    def test_hazard_spikes_drawn_in_one_call(self, renderer):
+        """Test a row of spikes is drawn as a single polygon.
+
+        Args:
+            renderer: The renderer fixture.
+        """
+        hazard = Hazard(0, 0, 40, 20, config=renderer.config)
+        
+        with patch('pygame.draw.polygon', wraps=pygame.draw.polygon) as mock_polygon:
+            sprite = renderer._get_hazard_sprite(hazard)
+        
+        mock_polygon.assert_called_once()
+        assert sprite.get_at((15, 1))[:3] == (255, 50, 0)
+        assert sprite.get_at((10, 1))[:3] == hazard.color
+    
     def test_draw_level(self, renderer):
         """Test draw_level draws all level elements.
 
@@ -383,6 +458,68 @@ class TestRenderer:
         
         renderer.draw_level(level)
     
+    def test_draw_level_skips_off_screen_objects(self, renderer):
+        """Test draw_level only decorates objects near the view.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that far away enemies and hazards are never drawn.
+        """
+        config = renderer.config
+        level = Level(config)
+        level.add_enemy(Enemy(200, 100, config=config))
+        level.add_enemy(Enemy(5000, 100, config=config))
+        level.add_hazard(Hazard(300, 550, 50, 20, config=config))
+        level.add_hazard(Hazard(6000, 550, 50, 20, config=config))
+        
+        with patch.object(
+            renderer, '_get_enemy_sprite', wraps=renderer._get_enemy_sprite
+        ) as mock_enemy:
+            with patch.object(
+                renderer, '_get_hazard_sprite', wraps=renderer._get_hazard_sprite
+            ) as mock_hazard:
+                renderer.draw_level(level)
+        
+        assert mock_enemy.call_count == 1
+        assert mock_hazard.call_count == 1
+    
+    def test_draw_level_clips_platform_at_left_edge(self, renderer):
+        """Test a platform straddling the left edge is filled only where visible.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that batched fills clip rects that start left of the screen.
+        """
+        level = Level(renderer.config)
+        platform = Platform(-84, 300, 150, 25, config=renderer.config)
+        level.add_platform(platform)
+        
+        renderer.draw_level(level)
+        
+        assert renderer.screen.get_at((65, 310))[:3] == platform.color
+        assert renderer.screen.get_at((66, 310))[:3] != platform.color
+    
+    def test_draw_level_platform_x_from_float_position(self, renderer):
+        """Test a fractional platform is placed from its float x, not its rect.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that x=110.7 with the camera at 0.5 starts at screen x 110,
+        where the truncated rect x would give 109.
+        """
+        level = Level(renderer.config)
+        platform = Platform(110.7, 300, 150, 25, config=renderer.config)
+        level.add_platform(platform)
+        level.camera_x = 0.5
+        
+        renderer.draw_level(level)
+        
+        assert renderer.screen.get_at((110, 310))[:3] == platform.color
+        assert renderer.screen.get_at((109, 310))[:3] != platform.color
+    
     def test_draw_ui(self, renderer, player):
         """Test draw_ui draws UI elements.
 
@@ -406,6 +543,73 @@ class TestRenderer:
         renderer.config.debug_mode = True
         renderer.draw_ui(player, score=100, lives=3)
     
+    def test_draw_ui_debug_lines_rerender_on_change(self, renderer, player):
+        """Test debug lines are only rendered again when the shown values change.
+
+        Args:
+            renderer: The renderer fixture.
+            player: The player fixture.
+        """
+        renderer.config.debug_mode = True
+        renderer.draw_ui(player)
+        surfaces = renderer._debug_surfaces
+        
+        player.x += 0.01
+        renderer.draw_ui(player)
+        assert renderer._debug_surfaces is surfaces
+        
+        player.x += 1
+        renderer.draw_ui(player)
+        assert renderer._debug_surfaces is not surfaces
+        assert renderer._debug_state[0] == round(player.x, 1)
+    
+    def test_draw_ui_reuses_fonts(self, renderer, player):
+        """Test drawing UI and overlays loads no fonts.
+
+        Args:
+            renderer: The renderer fixture.
+            player: The player fixture.
+
+        Verifies that the fonts created in __init__ are reused every frame.
+        """
+        renderer.config.debug_mode = True
+        with patch('pygame.font.Font') as mock_font:
+            renderer.draw_ui(player, score=100, lives=3)
+            renderer.draw_game_over()
+            renderer.draw_pause()
+        
+        mock_font.assert_not_called()
+    
+    def test_render_text_is_cached(self, renderer):
+        """Test identical text is rendered once and then reused.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that the same (text, color, font) returns the same surface.
+        """
+        first = renderer._render_text(renderer._font_ui, "Score: 10", (255, 255, 255))
+        second = renderer._render_text(renderer._font_ui, "Score: 10", (255, 255, 255))
+        
+        assert first is second
+    
+    def test_render_text_cache_evicts_oldest(self, renderer):
+        """Test the text cache is capped and drops the least recent entry.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that the cache never grows past TEXT_CACHE_SIZE entries.
+        """
+        renderer.TEXT_CACHE_SIZE = 2
+        font = renderer._font_debug
+        renderer._render_text(font, "a", (255, 255, 255))
+        renderer._render_text(font, "b", (255, 255, 255))
+        renderer._render_text(font, "a", (255, 255, 255))
+        renderer._render_text(font, "c", (255, 255, 255))
+        
+        assert [key[0] for key in renderer._text_cache] == ["a", "c"]
+    
     def test_draw_game_over(self, renderer):
         """Test draw_game_over draws overlay.
 
@@ -416,6 +620,20 @@ class TestRenderer:
         """
         renderer.draw_game_over()
     
+    def test_overlays_are_prebuilt(self, renderer):
+        """Test the dim overlays are not recreated every frame.
+
+        Args:
+            renderer: The renderer fixture.
+
+        Verifies that drawing the overlays allocates no new surfaces.
+        """
+        with patch('pygame.Surface') as mock_surface:
+            renderer.draw_game_over()
+            renderer.draw_pause()
+        
+        mock_surface.assert_not_called()
+    
     def test_draw_pause(self, renderer):
         """Test draw_pause draws overlay.
 
@@ -425,3 +643,44 @@ class TestRenderer:
         Verifies that the pause overlay is rendered correctly.
         """
         renderer.draw_pause()
+    
+    def test_present_flips_by_default(self, renderer, player):
+        """Test present shows the whole frame without dirty rect updates.
+
+        Args:
+            renderer: The renderer fixture.
+            player: The player fixture.
+        """
+        renderer.draw_player(player)
+        
+        with patch('pygame.display.flip') as mock_flip, \
+             patch('pygame.display.update') as mock_update:
+            renderer.present()
+        
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+        assert renderer._dirty_rects == []
+    
+    def test_present_updates_dirty_rects(self, renderer, player):
+        """Test present sends only the regions drawn this and last frame.
+
+        Args:
+            renderer: The renderer fixture.
+            player: The player fixture.
+
+        Verifies that the first frame is shown whole and that a moved
+        player updates both its old and new position.
+        """
+        renderer.config.dirty_rect_updates = True
+        
+        with patch('pygame.display.update') as mock_update:
+            renderer.draw_player(player)
+            renderer.present()
+            first_rect = mock_update.call_args[0][0][-1]
+            
+            player.x += 50
+            renderer.draw_player(player)
+            renderer.present()
+        
+        assert mock_update.call_args_list[0][0][0][0] == renderer.screen.get_rect()
+        assert mock_update.call_args[0][0] == [first_rect, first_rect.move(50, 0)]